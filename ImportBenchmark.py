@@ -0,0 +1,90 @@
+import os
+import pkgutil
+import statistics
+import subprocess
+import sys
+import time
+
+class ImportBenchmark:
+    PACKAGES: list[str] = [f'task{number}' for number in range(1, 9)]
+    DEFAULT_REPEATS: int = 5
+
+    # the child reports its own import time and whether NumPy came along with the module
+    PROBE = (
+        "import sys, time\n"
+        "started_at = time.perf_counter()\n"
+        "import {module}\n"
+        "print(time.perf_counter() - started_at, 'numpy' in sys.modules, file=sys.stderr)\n"
+    )
+
+    @staticmethod
+    def get_modules() -> list[str]:
+        root = os.path.dirname(os.path.abspath(__file__))
+        modules = []
+
+        for package in ImportBenchmark.PACKAGES:
+            modules.append(package)
+
+            for module in pkgutil.iter_modules([os.path.join(root, package)]):
+                modules.append(f'{package}.{module.name}')
+
+        return modules
+
+    @staticmethod
+    def measure(module: str | None, repeats: int) -> (float, float, bool, str):
+        root = os.path.dirname(os.path.abspath(__file__))
+        code = ImportBenchmark.PROBE.format(module=module) if module is not None else 'pass'
+
+        cold_starts, import_times = [], []
+        is_numpy_loaded, output = False, ''
+
+        for _ in range(repeats):
+            started_at = time.perf_counter()
+
+            # stdin is closed so a module that still reads input at import fails instead of blocking
+            completed = subprocess.run(
+                [sys.executable, '-c', code],
+                cwd=root,
+                stdin=subprocess.DEVNULL,
+                capture_output=True,
+                text=True,
+            )
+
+            cold_starts.append(time.perf_counter() - started_at)
+
+            if completed.returncode != 0:
+                return cold_starts[-1], 0.0, False, completed.stderr.strip().splitlines()[-1]
+
+            if module is not None:
+                import_time, is_numpy_loaded = completed.stderr.split()
+                import_times.append(float(import_time))
+                is_numpy_loaded = is_numpy_loaded == 'True'
+
+            output = completed.stdout.strip()
+
+        return (
+            statistics.median(cold_starts),
+            statistics.median(import_times) if import_times else 0.0,
+            is_numpy_loaded,
+            output,
+        )
+
+    @staticmethod
+    def execute(modules: list[str], repeats: int = DEFAULT_REPEATS) -> list[(str, float, float, bool, str)]:
+        results = [('(interpreter)', *ImportBenchmark.measure(None, repeats))]
+
+        for module in modules:
+            results.append((module, *ImportBenchmark.measure(module, repeats)))
+
+        return results
+
+if __name__ == '__main__':
+    modules = sys.argv[1:] or ImportBenchmark.get_modules()
+
+    print(f"{'module':<44}{'cold, ms':>10}{'import, ms':>12}{'numpy':>7}  side effects")
+    for module, cold_start, import_time, is_numpy_loaded, output in ImportBenchmark.execute(modules):
+        side_effects = output.replace('\n', ' | ')[:40] or '-'
+        print(
+            f"{module:<44}{cold_start * 1000:>10.1f}{import_time * 1000:>12.1f}"
+            f"{'yes' if is_numpy_loaded else 'no':>7}  {side_effects}"
+        )
@@ -139,5 +139,5 @@ class RelevanceManager:
 
         return low
 
-rm = RelevanceManager()
-
+if __name__ == '__main__':
+    rm = RelevanceManager()
@@ -0,0 +1,241 @@
+from bisect import bisect_left
+from typing import Iterator, Optional
+
+class BTreeNode:
+    keys: list[int]
+    values: list[any]
+    children: list['BTreeNode']
+
+    def __init__(
+            self,
+            keys: Optional[list[int]] = None,
+            values: Optional[list[any]] = None,
+            children: Optional[list['BTreeNode']] = None,
+    ):
+        self.keys = keys if keys is not None else []
+        self.values = values if values is not None else []
+        self.children = children if children is not None else []
+
+    def is_leaf(self) -> bool:
+        return not self.children
+
+class BTreeEntry:
+    key: int
+    data: any
+
+    def __init__(self, key: int, data: any):
+        self.key = key
+        self.data = data
+
+class BTree:
+    DEFAULT_FANOUT: int = 64
+
+    root: BTreeNode
+
+    def __init__(self, fanout: int = DEFAULT_FANOUT):
+        if fanout < 4:
+            raise ValueError('B-tree fanout must be at least 4')
+
+        # a full node splits into two halves around its middle key, so the fanout is 2 * min_degree
+        if fanout % 2 != 0:
+            raise ValueError('B-tree fanout must be even')
+
+        self.root = BTreeNode()
+        self.__min_degree = fanout // 2
+        self.__max_keys = 2 * self.__min_degree - 1
+
+    def __str__(self):
+        if self.root.keys:
+            return self.__tree_print(self.root)
+        return 'Tree is empty'
+
+    def __tree_print(self, node: BTreeNode, prefix: str = '') -> str:
+        result = prefix + str(node.keys) + '\n'
+
+        for child in node.children:
+            result += self.__tree_print(child, prefix + '    ')
+
+        return result
+
+    def get(self, key: int) -> Optional[BTreeEntry]:
+        node = self.root
+
+        while True:
+            keys = node.keys
+            i = bisect_left(keys, key)
+
+            if i < len(keys) and keys[i] == key:
+                return BTreeEntry(key, node.values[i])
+
+            if not node.children:
+                return None
+
+            node = node.children[i]
+
+    def items(self) -> Iterator[tuple[int, any]]:
+        return self.__items(self.root)
+
+    def __items(self, node: BTreeNode) -> Iterator[tuple[int, any]]:
+        if node.is_leaf():
+            yield from zip(node.keys, node.values)
+            return
+
+        for i in range(len(node.keys)):
+            yield from self.__items(node.children[i])
+            yield node.keys[i], node.values[i]
+
+        yield from self.__items(node.children[-1])
+
+    def add(self, key: int, data: any):
+        if len(self.root.keys) == self.__max_keys:
+            self.root = BTreeNode(children=[self.root])
+            self.__split_child(self.root, 0)
+
+        node = self.root
+
+        while True:
+            i = bisect_left(node.keys, key)
+
+            if i < len(node.keys) and node.keys[i] == key:
+                node.values[i] = data
+                return
+
+            if node.is_leaf():
+                node.keys.insert(i, key)
+                node.values.insert(i, data)
+                return
+
+            if len(node.children[i].keys) == self.__max_keys:
+                self.__split_child(node, i)
+
+                if key == node.keys[i]:
+                    node.values[i] = data
+                    return
+
+                if key > node.keys[i]:
+                    i += 1
+
+            node = node.children[i]
+
+    def __split_child(self, parent: BTreeNode, index: int) -> None:
+        child = parent.children[index]
+        middle = self.__min_degree - 1
+
+        right = BTreeNode(
+            child.keys[middle + 1:],
+            child.values[middle + 1:],
+            child.children[middle + 1:],
+        )
+
+        parent.keys.insert(index, child.keys[middle])
+        parent.values.insert(index, child.values[middle])
+        parent.children.insert(index + 1, right)
+
+        del child.keys[middle:]
+        del child.values[middle:]
+        del child.children[middle + 1:]
+
+    def delete(self, key: int) -> None:
+        is_deleted = self.__delete(key)
+
+        if not self.root.keys and not self.root.is_leaf():
+            self.root = self.root.children[0]
+
+        if not is_deleted:
+            raise Exception(f"Sheet with the key {key} is not in the tree.")
+
+    def __delete(self, key: int) -> bool:
+        node = self.root
+
+        while True:
+            i = bisect_left(node.keys, key)
+            is_found = i < len(node.keys) and node.keys[i] == key
+
+            if node.is_leaf():
+                if not is_found:
+                    return False
+
+                del node.keys[i]
+                del node.values[i]
+                return True
+
+            if is_found:
+                left, right = node.children[i], node.children[i + 1]
+
+                if len(left.keys) > self.__min_degree - 1:
+                    key, node.values[i] = self.__get_max_item(left)
+                    node.keys[i] = key
+                    node = left
+                elif len(right.keys) > self.__min_degree - 1:
+                    key, node.values[i] = self.__get_min_item(right)
+                    node.keys[i] = key
+                    node = right
+                else:
+                    self.__merge_children(node, i)
+                    node = left
+
+                continue
+
+            if len(node.children[i].keys) < self.__min_degree:
+                i = self.__fill_child(node, i)
+
+            node = node.children[i]
+
+    def __get_min_item(self, node: BTreeNode) -> (int, any):
+        while node.children:
+            node = node.children[0]
+
+        return node.keys[0], node.values[0]
+
+    def __get_max_item(self, node: BTreeNode) -> (int, any):
+        while node.children:
+            node = node.children[-1]
+
+        return node.keys[-1], node.values[-1]
+
+    def __fill_child(self, parent: BTreeNode, index: int) -> int:
+        child = parent.children[index]
+
+        if index > 0 and len(parent.children[index - 1].keys) >= self.__min_degree:
+            left = parent.children[index - 1]
+
+            child.keys.insert(0, parent.keys[index - 1])
+            child.values.insert(0, parent.values[index - 1])
+            parent.keys[index - 1] = left.keys.pop()
+            parent.values[index - 1] = left.values.pop()
+
+            if left.children:
+                child.children.insert(0, left.children.pop())
+
+            return index
+
+        if index < len(parent.keys) and len(parent.children[index + 1].keys) >= self.__min_degree:
+            right = parent.children[index + 1]
+
+            child.keys.append(parent.keys[index])
+            child.values.append(parent.values[index])
+            parent.keys[index] = right.keys.pop(0)
+            parent.values[index] = right.values.pop(0)
+
+            if right.children:
+                child.children.append(right.children.pop(0))
+
+            return index
+
+        if index < len(parent.keys):
+            self.__merge_children(parent, index)
+            return index
+
+        self.__merge_children(parent, index - 1)
+        return index - 1
+
+    def __merge_children(self, parent: BTreeNode, index: int) -> None:
+        left = parent.children[index]
+        right = parent.children.pop(index + 1)
+
+        left.keys.append(parent.keys.pop(index))
+        left.values.append(parent.values.pop(index))
+
+        left.keys.extend(right.keys)
+        left.values.extend(right.values)
+        left.children.extend(right.children)
@@ -0,0 +1,56 @@
+import random
+import sys
+import time
+
+from task4.BTree import BTree
+from task4.RedBlackTree import RedBlackTree
+
+class BTreeBenchmark:
+    DEFAULT_SIZES: list[int] = [10 ** 6, 10 ** 7]
+    DEFAULT_FANOUTS: list[int] = [16, 64, 256]
+    DEFAULT_SEED: int = 42
+
+    @staticmethod
+    def execute(
+            sizes: list[int] = DEFAULT_SIZES,
+            fanouts: list[int] = DEFAULT_FANOUTS,
+            seed: int = DEFAULT_SEED,
+    ) -> list[(str, int, float, float, float)]:
+        results = []
+
+        for size in sizes:
+            keys = random.Random(seed).sample(range(size * 4), size)
+
+            backends = [('RedBlackTree', RedBlackTree)]
+            backends += [(f'BTree({fanout})', lambda fanout=fanout: BTree(fanout)) for fanout in fanouts]
+
+            for name, tree_factory in backends:
+                results.append((name, size) + BTreeBenchmark.__measure(tree_factory(), keys))
+
+        return results
+
+    @staticmethod
+    def __measure(tree, keys: list[int]) -> (float, float, float):
+        started_at = time.perf_counter()
+        for key in keys:
+            tree.add(key, key)
+        add_seconds = time.perf_counter() - started_at
+
+        started_at = time.perf_counter()
+        for key in keys:
+            tree.get(key)
+        get_seconds = time.perf_counter() - started_at
+
+        started_at = time.perf_counter()
+        for key in keys:
+            tree.delete(key)
+        delete_seconds = time.perf_counter() - started_at
+
+        return add_seconds, get_seconds, delete_seconds
+
+if __name__ == '__main__':
+    sizes = [int(size) for size in sys.argv[1:]] or BTreeBenchmark.DEFAULT_SIZES
+
+    print(f"{'backend':<14}{'keys':>10}{'add, s':>10}{'get, s':>10}{'delete, s':>12}")
+    for name, size, add_seconds, get_seconds, delete_seconds in BTreeBenchmark.execute(sizes):
+        print(f"{name:<14}{size:>10}{add_seconds:>10.2f}{get_seconds:>10.2f}{delete_seconds:>12.2f}")
@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import Optional
+from typing import Iterator, Optional
 
 class NodeColor(Enum):
     RED = 1
@@ -75,6 +75,7 @@ class Node:
 
 class RedBlackTree:
     root: Optional['Node'] = None
+    rotations_count: int = 0
 
     def __str__(self):
         if self.root:
@@ -115,6 +116,19 @@ class RedBlackTree:
 
         return None
 
+    def items(self) -> Iterator[tuple[int, any]]:
+        stack = []
+        current = self.root
+
+        while stack or current is not None:
+            while current is not None:
+                stack.append(current)
+                current = current.left
+
+            current = stack.pop()
+            yield current.key, current.data
+            current = current.right
+
     def add(self, key: int, data: any):
         if self.root is None:
             self.root = Node(key, data, None, NodeColor.BLACK)
@@ -146,6 +160,8 @@ class RedBlackTree:
         if node.parent is None:
             raise Exception('Leaf does not have a parent whose place it wants to take')
 
+        self.rotations_count += 1
+
         old_root = node.parent
         new_root = node
         new_root_old_left_node = new_root.left
@@ -164,6 +180,8 @@ class RedBlackTree:
         if node.parent is None:
             raise Exception('Leaf does not have a parent whose place it wants to take')
 
+        self.rotations_count += 1
+
         old_root = node.parent
         new_root = node
         new_root_old_right_node = new_root.right
@@ -0,0 +1,126 @@
+import random
+import sys
+import time
+import tracemalloc
+from typing import Iterator
+
+from task4.RedBlackTree import RedBlackTree
+from task4.RedBlackTreeValidator import RedBlackTreeValidator
+
+class RedBlackTreeBenchmark:
+    ADD_OPERATION: str = 'add'
+    GET_OPERATION: str = 'get'
+    DELETE_OPERATION: str = 'delete'
+
+    DEFAULT_SIZES: list[int] = [10 ** 3, 10 ** 4, 10 ** 5]
+    DEFAULT_SEED: int = 42
+    OPERATIONS_PER_KEY: int = 4
+    VALIDATION_INTERVAL: int = 1000
+
+    @staticmethod
+    def generate_operations(
+            size: int,
+            operations_count: int,
+            seed: int = DEFAULT_SEED,
+            add_ratio: float = 0.4,
+            get_ratio: float = 0.4,
+    ) -> Iterator[tuple[str, int]]:
+        generator = random.Random(seed)
+
+        for _ in range(operations_count):
+            key = generator.randrange(size)
+            choice = generator.random()
+
+            if choice < add_ratio:
+                yield RedBlackTreeBenchmark.ADD_OPERATION, key
+            elif choice < add_ratio + get_ratio:
+                yield RedBlackTreeBenchmark.GET_OPERATION, key
+            else:
+                yield RedBlackTreeBenchmark.DELETE_OPERATION, key
+
+    @staticmethod
+    def execute(
+            sizes: list[int] = DEFAULT_SIZES,
+            seed: int = DEFAULT_SEED,
+            is_validated: bool = True,
+    ) -> list[(int, int, float, int, int)]:
+        results = []
+
+        for size in sizes:
+            operations = list(RedBlackTreeBenchmark.generate_operations(
+                size,
+                size * RedBlackTreeBenchmark.OPERATIONS_PER_KEY,
+                seed
+            ))
+
+            if is_validated:
+                RedBlackTreeBenchmark.__check_correctness(operations)
+
+            tree = RedBlackTree()
+
+            started_at = time.perf_counter()
+            RedBlackTreeBenchmark.__run(tree, operations)
+            elapsed_seconds = time.perf_counter() - started_at
+
+            # tracing slows every allocation down, so the peak is taken from a separate replay
+            tracemalloc.start()
+            RedBlackTreeBenchmark.__run(RedBlackTree(), operations)
+            _, peak_memory = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            results.append((
+                size,
+                len(operations),
+                len(operations) / elapsed_seconds,
+                tree.rotations_count,
+                peak_memory,
+            ))
+
+        return results
+
+    @staticmethod
+    def __run(tree: RedBlackTree, operations: list[(str, int)]) -> None:
+        for operation, key in operations:
+            match operation:
+                case RedBlackTreeBenchmark.ADD_OPERATION:
+                    tree.add(key, key)
+                case RedBlackTreeBenchmark.GET_OPERATION:
+                    tree.get(key)
+                case RedBlackTreeBenchmark.DELETE_OPERATION:
+                    if tree.get(key) is not None:
+                        tree.delete(key)
+
+    @staticmethod
+    def __check_correctness(operations: list[(str, int)]) -> None:
+        tree = RedBlackTree()
+        expected = {}
+
+        for index, (operation, key) in enumerate(operations):
+            match operation:
+                case RedBlackTreeBenchmark.ADD_OPERATION:
+                    tree.add(key, index)
+                    expected[key] = index
+                case RedBlackTreeBenchmark.GET_OPERATION:
+                    node = tree.get(key)
+                    if (node.data if node is not None else None) != expected.get(key):
+                        raise ValueError(f"Operation {index}: wrong value for key {key}")
+                case RedBlackTreeBenchmark.DELETE_OPERATION:
+                    if key in expected:
+                        tree.delete(key)
+                        del expected[key]
+
+            if index % RedBlackTreeBenchmark.VALIDATION_INTERVAL == 0:
+                RedBlackTreeValidator.validate(tree)
+
+        RedBlackTreeValidator.validate(tree)
+
+        for key, value in expected.items():
+            if tree.get(key).data != value:
+                raise ValueError(f"Key {key} lost its value")
+
+if __name__ == '__main__':
+    sizes = [int(size) for size in sys.argv[1:]] or RedBlackTreeBenchmark.DEFAULT_SIZES
+
+    print(f"{'keys':>10}{'operations':>12}{'ops/sec':>12}{'rotations':>12}{'peak, KiB':>12}")
+    for size, operations_count, ops_per_second, rotations_count, peak_memory in RedBlackTreeBenchmark.execute(sizes):
+        print(f"{size:>10}{operations_count:>12}{ops_per_second:>12.0f}{rotations_count:>12}{peak_memory / 1024:>12.0f}")
@@ -0,0 +1,51 @@
+from typing import Optional
+
+from task4.RedBlackTree import Node, NodeColor, RedBlackTree
+
+class RedBlackTreeValidator:
+
+    @staticmethod
+    def validate(tree: RedBlackTree) -> int:
+        if tree.root is None:
+            return 0
+
+        if tree.root.parent is not None:
+            raise ValueError(f"Root {tree.root.key} has a parent link")
+
+        if tree.root.color != NodeColor.BLACK:
+            raise ValueError(f"Root {tree.root.key} is not black")
+
+        return RedBlackTreeValidator.__validate_subtree(tree.root, None, None)
+
+    @staticmethod
+    def __validate_subtree(
+            node: Optional[Node],
+            lower_key: Optional[int],
+            upper_key: Optional[int],
+    ) -> int:
+        if node is None:
+            return 1
+
+        if (lower_key is not None and node.key <= lower_key) or \
+                (upper_key is not None and node.key >= upper_key):
+            raise ValueError(f"Key {node.key} breaks the search tree order")
+
+        for child in (node.left, node.right):
+            if child is None:
+                continue
+
+            if child.parent is not node:
+                raise ValueError(f"Node {child.key} does not point back to its parent {node.key}")
+
+            if node.color == NodeColor.RED and child.color == NodeColor.RED:
+                raise ValueError(f"Red node {node.key} has a red child {child.key}")
+
+        left_black_height = RedBlackTreeValidator.__validate_subtree(node.left, lower_key, node.key)
+        right_black_height = RedBlackTreeValidator.__validate_subtree(node.right, node.key, upper_key)
+
+        if left_black_height != right_black_height:
+            raise ValueError(
+                f"Node {node.key} has black heights {left_black_height} and {right_black_height}"
+            )
+
+        return left_black_height + (1 if node.color == NodeColor.BLACK else 0)
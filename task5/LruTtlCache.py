@@ -0,0 +1,158 @@
+import time
+from functools import wraps
+from itertools import count
+from typing import Callable, Optional
+
+from task4.RedBlackTree import RedBlackTree
+from task5.RedBlackHashTable import RedBlackHashTable
+
+class LruTtlCache:
+
+    class Entry:
+        key: any
+        value: any
+        expiry_key: Optional[tuple[float, int]] = None
+        previous: Optional['LruTtlCache.Entry'] = None
+        next: Optional['LruTtlCache.Entry'] = None
+
+        def __init__(self, key: any = None, value: any = None):
+            self.key = key
+            self.value = value
+
+    hits_count: int = 0
+    misses_count: int = 0
+    evictions_count: int = 0
+    expirations_count: int = 0
+
+    def __init__(
+            self,
+            capacity: int,
+            ttl: Optional[float] = None,
+            clock: Callable[[], float] = time.monotonic,
+    ):
+        if capacity <= 0:
+            raise ValueError('Cache capacity must be positive')
+
+        self.capacity = capacity
+        self.ttl = ttl
+        self.__clock = clock
+        self.__table = RedBlackHashTable()
+        self.__expiry_index = RedBlackTree()
+        self.__expiry_sequence = count()
+
+        self.__head = LruTtlCache.Entry()
+        self.__head.previous = self.__head.next = self.__head
+
+    def __len__(self) -> int:
+        self.__remove_expired()
+
+        return len(self.__table)
+
+    def __contains__(self, key: any) -> bool:
+        self.__remove_expired()
+
+        return key in self.__table
+
+    def get(self, key: any, default: Optional[any] = None) -> Optional[any]:
+        self.__remove_expired()
+
+        entry = self.__table.get(key)
+
+        if entry is None:
+            self.misses_count += 1
+            return default
+
+        self.hits_count += 1
+        self.__unlink(entry)
+        self.__link_first(entry)
+
+        return entry.value
+
+    def put(self, key: any, value: any, ttl: Optional[float] = None) -> None:
+        self.__remove_expired()
+
+        entry = self.__table.get(key)
+
+        if entry is None:
+            if len(self.__table) >= self.capacity:
+                self.__remove(self.__head.previous)
+                self.evictions_count += 1
+
+            entry = LruTtlCache.Entry(key, value)
+            self.__table.put(key, entry)
+        else:
+            entry.value = value
+            self.__unlink(entry)
+            self.__unindex_expiry(entry)
+
+        self.__link_first(entry)
+
+        ttl = ttl if ttl is not None else self.ttl
+
+        if ttl is not None:
+            entry.expiry_key = (self.__clock() + ttl, next(self.__expiry_sequence))
+            self.__expiry_index.add(entry.expiry_key, key)
+
+    def delete(self, key: any) -> None:
+        entry = self.__table.get(key)
+
+        if entry is None:
+            raise KeyError(key)
+
+        self.__remove(entry)
+
+    def __remove_expired(self) -> None:
+        now = self.__clock()
+
+        while True:
+            earliest = next(self.__expiry_index.items(), None)
+
+            if earliest is None or earliest[0][0] > now:
+                return
+
+            self.__remove(self.__table.get(earliest[1]))
+            self.expirations_count += 1
+
+    def __remove(self, entry: Entry) -> None:
+        self.__unlink(entry)
+        self.__unindex_expiry(entry)
+        self.__table.delete(entry.key)
+
+    def __unindex_expiry(self, entry: Entry) -> None:
+        if entry.expiry_key is not None:
+            self.__expiry_index.delete(entry.expiry_key)
+            entry.expiry_key = None
+
+    def __link_first(self, entry: Entry) -> None:
+        entry.previous = self.__head
+        entry.next = self.__head.next
+        self.__head.next.previous = entry
+        self.__head.next = entry
+
+    def __unlink(self, entry: Entry) -> None:
+        entry.previous.next = entry.next
+        entry.next.previous = entry.previous
+
+    @staticmethod
+    def memoize(capacity: int, ttl: Optional[float] = None) -> Callable[[Callable], Callable]:
+        def decorator(function: Callable) -> Callable:
+            cache = LruTtlCache(capacity, ttl)
+            missing = object()
+
+            @wraps(function)
+            def wrapper(*args, **kwargs):
+                # positional and keyword arguments stay in separate slots so neither can pass for the other
+                key = (args, tuple(sorted(kwargs.items())))
+                result = cache.get(key, missing)
+
+                if result is missing:
+                    result = function(*args, **kwargs)
+                    cache.put(key, result)
+
+                return result
+
+            wrapper.cache = cache
+
+            return wrapper
+
+        return decorator
@@ -1,31 +1,331 @@
-from typing import Optional
+from bisect import bisect_left, insort
+from collections.abc import Iterable, MutableMapping
+from typing import Iterator, Optional
 
 from task4.RedBlackTree import RedBlackTree
 
-class RedBlackHashTable:
-    def __init__(self):
-        self.tree = RedBlackTree()
+# the entries of one tree node, kept sorted by key while every key has the same totally ordered type
+class KeyOrderedChain(list):
+    ORDERED_KEY_TYPES: tuple[type, ...] = (int, str, bytes)
+
+    key_type: Optional[type]
+
+    def __init__(self, entry: tuple[int, any, any]):
+        super().__init__([entry])
+        self.key_type = type(entry[1]) if type(entry[1]) in KeyOrderedChain.ORDERED_KEY_TYPES else None
+
+    def is_ordered_for(self, key: any) -> bool:
+        return self.key_type is not None and type(key) is self.key_type
+
+class RedBlackHashTable(MutableMapping):
+    INITIAL_CAPACITY: int = 16
+    LOAD_FACTOR: float = 0.75
+    TREEIFY_THRESHOLD: int = 8
+    UNTREEIFY_THRESHOLD: int = 6
+
+    def __init__(
+            self,
+            tree_class: type = RedBlackTree,
+            capacity: int = INITIAL_CAPACITY,
+    ):
+        self.tree_class = tree_class
+        self.__size = 0
+        self.__create_buckets(RedBlackHashTable.__round_capacity(capacity))
+
+    def __getitem__(self, key: any) -> any:
+        entry = self.__find_entry(hash(key), key)
+
+        if entry is None:
+            raise KeyError(key)
+
+        return entry[2]
+
+    def __setitem__(self, key: any, value: any) -> None:
+        self.put(key, value)
+
+    def __delitem__(self, key: any) -> None:
+        self.delete(key)
+
+    def __contains__(self, key: any) -> bool:
+        return self.__find_entry(hash(key), key) is not None
+
+    def __len__(self) -> int:
+        return self.__size
+
+    def __iter__(self) -> Iterator[any]:
+        for _, key, _ in self.__entries():
+            yield key
 
     def put(self, key: any, value: any) -> None:
-        self.tree.add(key.__hash__(), value)
+        self.__put(hash(key), key, value)
+        self.__resize_if_overloaded()
 
-    def get(self, key: any) -> Optional[any]:
-        node = self.tree.get(key.__hash__())
+    def get(self, key: any, default: Optional[any] = None) -> Optional[any]:
+        entry = self.__find_entry(hash(key), key)
 
-        return node.data if node is not None else None
+        return entry[2] if entry is not None else default
 
     def delete(self, key: any) -> None:
-        self.tree.delete(key.__hash__())
+        self.__delete(hash(key), key)
+
+    def put_many(self, items: Iterable[tuple[any, any]]) -> None:
+        # the last value of a repeated key wins, as it would with consecutive puts
+        batch = [(hash(key), key, value) for key, value in dict(items).items()]
+        new_keys_count = sum(1 for key_hash, key, _ in batch if self.__find_entry(key_hash, key) is None)
+
+        while self.__size + new_keys_count > len(self.__buckets) * RedBlackHashTable.LOAD_FACTOR:
+            self.__resize(len(self.__buckets) * 2)
+
+        for key_hash, key, value in self.__sort_by_bucket(batch):
+            self.__put(key_hash, key, value)
+
+    def get_many(
+            self,
+            keys: Iterable[any],
+            default: Optional[any] = None
+    ) -> list[Optional[any]]:
+        batch = [(hash(key), key, position) for position, key in enumerate(keys)]
+        values = [default] * len(batch)
+
+        for key_hash, key, position in self.__sort_by_bucket(batch):
+            entry = self.__find_entry(key_hash, key)
+
+            if entry is not None:
+                values[position] = entry[2]
+
+        return values
+
+    def delete_many(self, keys: Iterable[any]) -> None:
+        batch = self.__sort_by_bucket([(hash(key), key, None) for key in dict.fromkeys(keys)])
+
+        # every key is checked before the first deletion, so a missing key leaves the table untouched
+        for key_hash, key, _ in batch:
+            if self.__find_entry(key_hash, key) is None:
+                raise KeyError(key)
+
+        for key_hash, key, _ in batch:
+            self.__delete(key_hash, key)
+
+    def __sort_by_bucket(
+            self,
+            batch: list[tuple[int, any, any]]
+    ) -> list[tuple[int, any, any]]:
+        batch.sort(key=lambda entry: self.__get_bucket_index(entry[0]))
+
+        return batch
+
+    def __find_entry(self, key_hash: int, key: any) -> Optional[tuple[int, any, any]]:
+        bucket = self.__buckets[self.__get_bucket_index(key_hash)]
+
+        if bucket is None:
+            return None
+
+        if not isinstance(bucket, list):
+            node = bucket.get(key_hash)
+
+            if node is None:
+                return None
+
+            position = RedBlackHashTable.__find_in_node(node.data, key)
+
+            return node.data[position] if position >= 0 else None
+
+        for entry in bucket:
+            if entry[0] == key_hash and (entry[1] is key or entry[1] == key):
+                return entry
+
+        return None
+
+    def __put(self, key_hash: int, key: any, value: any) -> None:
+        index = self.__get_bucket_index(key_hash)
+        bucket = self.__buckets[index]
+
+        if bucket is None:
+            self.__buckets[index] = [(key_hash, key, value)]
+        elif isinstance(bucket, list):
+            if RedBlackHashTable.__replace_in_chain(bucket, key_hash, key, value):
+                return
+
+            bucket.append((key_hash, key, value))
+
+            if len(bucket) > RedBlackHashTable.TREEIFY_THRESHOLD:
+                self.__buckets[index] = self.__treeify(bucket)
+        else:
+            node = bucket.get(key_hash)
+
+            if node is None:
+                bucket.add(key_hash, KeyOrderedChain((key_hash, key, value)))
+            else:
+                position = RedBlackHashTable.__find_in_node(node.data, key)
+
+                if position >= 0:
+                    node.data[position] = (key_hash, node.data[position][1], value)
+                    return
+
+                RedBlackHashTable.__add_to_node(node.data, (key_hash, key, value))
+
+        self.__bucket_sizes[index] += 1
+        self.__size += 1
+
+    def __delete(self, key_hash: int, key: any) -> None:
+        index = self.__get_bucket_index(key_hash)
+        bucket = self.__buckets[index]
+
+        if bucket is None:
+            raise KeyError(key)
+
+        if isinstance(bucket, list):
+            RedBlackHashTable.__remove_from_chain(bucket, key_hash, key)
+
+            if not bucket:
+                self.__buckets[index] = None
+        else:
+            node = bucket.get(key_hash)
+
+            position = RedBlackHashTable.__find_in_node(node.data, key) if node is not None else -1
+
+            if position < 0:
+                raise KeyError(key)
+
+            del node.data[position]
+
+            if not node.data:
+                bucket.delete(key_hash)
+
+            if self.__bucket_sizes[index] - 1 <= RedBlackHashTable.UNTREEIFY_THRESHOLD:
+                self.__buckets[index] = RedBlackHashTable.__untreeify(bucket)
+
+        self.__bucket_sizes[index] -= 1
+        self.__size -= 1
+
+    def __entries(self) -> Iterator[tuple[int, any, any]]:
+        for bucket in self.__buckets:
+            if bucket is None:
+                continue
+
+            if isinstance(bucket, list):
+                yield from bucket
+            else:
+                yield from RedBlackHashTable.__untreeify(bucket)
+
+    def __get_bucket_index(self, key_hash: int) -> int:
+        return (key_hash ^ (key_hash >> 16)) & (len(self.__buckets) - 1)
+
+    def __create_buckets(self, capacity: int) -> None:
+        self.__buckets: list[Optional[list | RedBlackTree]] = [None] * capacity
+        self.__bucket_sizes: list[int] = [0] * capacity
+
+    def __resize_if_overloaded(self) -> None:
+        if self.__size > len(self.__buckets) * RedBlackHashTable.LOAD_FACTOR:
+            self.__resize(len(self.__buckets) * 2)
+
+    def __resize(self, capacity: int) -> None:
+        entries = list(self.__entries())
+        self.__create_buckets(capacity)
+
+        for entry in entries:
+            index = self.__get_bucket_index(entry[0])
+
+            if self.__buckets[index] is None:
+                self.__buckets[index] = []
+
+            self.__buckets[index].append(entry)
+            self.__bucket_sizes[index] += 1
+
+        for index, bucket in enumerate(self.__buckets):
+            if bucket is not None and len(bucket) > RedBlackHashTable.TREEIFY_THRESHOLD:
+                self.__buckets[index] = self.__treeify(bucket)
+
+    def __treeify(self, chain: list[tuple[int, any, any]]) -> RedBlackTree:
+        tree = self.tree_class()
+
+        for entry in chain:
+            node = tree.get(entry[0])
+
+            if node is None:
+                tree.add(entry[0], KeyOrderedChain(entry))
+            else:
+                RedBlackHashTable.__add_to_node(node.data, entry)
+
+        return tree
+
+    # keys sharing a full hash are searched by comparison, as Java's HashMap does with compareTo;
+    # any other key, including an equal one of another type, is matched by a linear scan with ==
+    @staticmethod
+    def __find_in_node(chain: KeyOrderedChain, key: any) -> int:
+        if chain.is_ordered_for(key):
+            position = bisect_left(chain, key, key=lambda entry: entry[1])
+
+            if position < len(chain) and chain[position][1] == key:
+                return position
+
+            return -1
+
+        for position, (_, entry_key, _) in enumerate(chain):
+            if entry_key is key or entry_key == key:
+                return position
+
+        return -1
+
+    @staticmethod
+    def __add_to_node(chain: KeyOrderedChain, entry: tuple[int, any, any]) -> None:
+        # the chain is shared with the tree node, so it only ever changes in place
+        if chain.is_ordered_for(entry[1]):
+            insort(chain, entry, key=lambda chained_entry: chained_entry[1])
+        else:
+            chain.key_type = None
+            chain.append(entry)
+
+    @staticmethod
+    def __untreeify(tree: RedBlackTree) -> list[tuple[int, any, any]]:
+        return [entry for _, chain in tree.items() for entry in chain]
+
+    @staticmethod
+    def __replace_in_chain(
+            chain: list[tuple[int, any, any]],
+            key_hash: int,
+            key: any,
+            value: any
+    ) -> bool:
+        for i, (entry_hash, entry_key, _) in enumerate(chain):
+            if entry_hash == key_hash and (entry_key is key or entry_key == key):
+                chain[i] = (key_hash, entry_key, value)
+                return True
+
+        return False
+
+    @staticmethod
+    def __remove_from_chain(
+            chain: list[tuple[int, any, any]],
+            key_hash: int,
+            key: any
+    ) -> None:
+        for i, (entry_hash, entry_key, _) in enumerate(chain):
+            if entry_hash == key_hash and (entry_key is key or entry_key == key):
+                del chain[i]
+                return
+
+        raise KeyError(key)
+
+    @staticmethod
+    def __round_capacity(capacity: int) -> int:
+        rounded_capacity = 1
+
+        while rounded_capacity < capacity:
+            rounded_capacity *= 2
+
+        return rounded_capacity
 
-ht = RedBlackHashTable()
-ht.put("Anton1", 1)
-ht.put("Anton2", 2)
-ht.put("Anton3", 3)
+if __name__ == '__main__':
+    ht = RedBlackHashTable()
+    ht.put("Anton1", 1)
+    ht.put("Anton2", 2)
+    ht.put("Anton3", 3)
 
-print(ht.get("Anton1"))
-print(ht.get("Anton2"))
-print(ht.get("Anton3"))
+    print(ht.get("Anton1"))
+    print(ht.get("Anton2"))
+    print(ht.get("Anton3"))
 
-ht.delete("Anton1")
+    ht.delete("Anton1")
 
-print(ht.get("Anton1"))
+    print(ht.get("Anton1"))
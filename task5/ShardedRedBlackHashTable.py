@@ -0,0 +1,88 @@
+from collections.abc import Iterable
+from threading import Lock
+from typing import Optional
+
+from task5.RedBlackHashTable import RedBlackHashTable
+
+class ShardedRedBlackHashTable:
+    DEFAULT_SHARDS_COUNT: int = 16
+    HASH_MULTIPLIER: int = 0x9E3779B97F4A7C15
+    HASH_MASK: int = (1 << 64) - 1
+
+    def __init__(self, shards_count: int = DEFAULT_SHARDS_COUNT):
+        if shards_count <= 0:
+            raise ValueError('Shards count must be positive')
+
+        self.shards = [RedBlackHashTable() for _ in range(shards_count)]
+        self.locks = [Lock() for _ in range(shards_count)]
+
+    def __len__(self) -> int:
+        return sum(len(shard) for shard in self.shards)
+
+    def __contains__(self, key: any) -> bool:
+        index = self.__get_shard_index(key)
+
+        with self.locks[index]:
+            return key in self.shards[index]
+
+    def put(self, key: any, value: any) -> None:
+        index = self.__get_shard_index(key)
+
+        with self.locks[index]:
+            self.shards[index].put(key, value)
+
+    def get(self, key: any, default: Optional[any] = None) -> Optional[any]:
+        index = self.__get_shard_index(key)
+
+        with self.locks[index]:
+            return self.shards[index].get(key, default)
+
+    def delete(self, key: any) -> None:
+        index = self.__get_shard_index(key)
+
+        with self.locks[index]:
+            self.shards[index].delete(key)
+
+    def put_many(self, items: Iterable[tuple[any, any]]) -> None:
+        batches = [[] for _ in self.shards]
+
+        for key, value in items:
+            batches[self.__get_shard_index(key)].append((key, value))
+
+        for index, batch in enumerate(batches):
+            if batch:
+                with self.locks[index]:
+                    self.shards[index].put_many(batch)
+
+    def get_many(
+            self,
+            keys: Iterable[any],
+            default: Optional[any] = None
+    ) -> list[Optional[any]]:
+        batches = [([], []) for _ in self.shards]
+        values_count = 0
+
+        for position, key in enumerate(keys):
+            positions, shard_keys = batches[self.__get_shard_index(key)]
+            positions.append(position)
+            shard_keys.append(key)
+            values_count += 1
+
+        values = [default] * values_count
+
+        for index, (positions, shard_keys) in enumerate(batches):
+            if not shard_keys:
+                continue
+
+            with self.locks[index]:
+                shard_values = self.shards[index].get_many(shard_keys, default)
+
+            for position, value in zip(positions, shard_values):
+                values[position] = value
+
+        return values
+
+    def __get_shard_index(self, key: any) -> int:
+        mixed_hash = (hash(key) * ShardedRedBlackHashTable.HASH_MULTIPLIER) & ShardedRedBlackHashTable.HASH_MASK
+
+        return (mixed_hash >> 32) % len(self.shards)
@@ -0,0 +1,94 @@
+import random
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+
+from task5.RedBlackHashTable import RedBlackHashTable
+from task5.ShardedRedBlackHashTable import ShardedRedBlackHashTable
+
+class ShardedRedBlackHashTableBenchmark:
+    DEFAULT_WORKERS_COUNTS: list[int] = [1, 2, 4, 8]
+    DEFAULT_OPERATIONS_COUNT: int = 200_000
+    KEYS_COUNT: int = 100_000
+    PUT_RATIO: float = 0.2
+    DEFAULT_SEED: int = 42
+
+    class LockedRedBlackHashTable:
+        def __init__(self):
+            self.table = RedBlackHashTable()
+            self.lock = Lock()
+
+        def put(self, key: any, value: any) -> None:
+            with self.lock:
+                self.table.put(key, value)
+
+        def get(self, key: any) -> any:
+            with self.lock:
+                return self.table.get(key)
+
+    @staticmethod
+    def execute(
+            workers_counts: list[int] = DEFAULT_WORKERS_COUNTS,
+            operations_count: int = DEFAULT_OPERATIONS_COUNT,
+    ) -> list[(str, int, float)]:
+        results = []
+
+        for workers_count in workers_counts:
+            backends = [
+                ('single lock', ShardedRedBlackHashTableBenchmark.LockedRedBlackHashTable()),
+                ('sharded', ShardedRedBlackHashTable()),
+            ]
+
+            for name, table in backends:
+                results.append((
+                    name,
+                    workers_count,
+                    ShardedRedBlackHashTableBenchmark.__measure(table, workers_count, operations_count),
+                ))
+
+        return results
+
+    @staticmethod
+    def __measure(table, workers_count: int, operations_count: int) -> float:
+        for key in range(ShardedRedBlackHashTableBenchmark.KEYS_COUNT):
+            table.put(key, key)
+
+        operations_per_worker = operations_count // workers_count
+
+        started_at = time.perf_counter()
+
+        with ThreadPoolExecutor(workers_count) as executor:
+            futures = [
+                executor.submit(
+                    ShardedRedBlackHashTableBenchmark.__run_worker,
+                    table,
+                    operations_per_worker,
+                    ShardedRedBlackHashTableBenchmark.DEFAULT_SEED + worker_index
+                )
+                for worker_index in range(workers_count)
+            ]
+
+            for future in futures:
+                future.result()
+
+        return operations_per_worker * workers_count / (time.perf_counter() - started_at)
+
+    @staticmethod
+    def __run_worker(table, operations_count: int, seed: int) -> None:
+        generator = random.Random(seed)
+
+        for _ in range(operations_count):
+            key = generator.randrange(ShardedRedBlackHashTableBenchmark.KEYS_COUNT)
+
+            if generator.random() < ShardedRedBlackHashTableBenchmark.PUT_RATIO:
+                table.put(key, seed)
+            else:
+                table.get(key)
+
+if __name__ == '__main__':
+    workers_counts = [int(count) for count in sys.argv[1:]] or ShardedRedBlackHashTableBenchmark.DEFAULT_WORKERS_COUNTS
+
+    print(f"{'table':<14}{'workers':>8}{'ops/sec':>12}")
+    for name, workers_count, ops_per_second in ShardedRedBlackHashTableBenchmark.execute(workers_counts):
+        print(f"{name:<14}{workers_count:>8}{ops_per_second:>12.0f}")
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+from task6.VectorizedVisitorRegistrator import VectorizedVisitorRegistrator
+
+class OccupancyAnalytics:
+
+    def __init__(self, visits: list((str, str))):
+        import numpy as np
+
+        if not visits:
+            raise ValueError('Visits list is empty')
+
+        start_dates, end_dates = zip(*visits)
+
+        self.__init_from_arrays(
+            np.asarray(start_dates, dtype='datetime64[D]'),
+            np.asarray(end_dates, dtype='datetime64[D]')
+        )
+
+    @staticmethod
+    def from_arrays(start_dates: np.array, end_dates: np.array) -> 'OccupancyAnalytics':
+        import numpy as np
+
+        analytics = OccupancyAnalytics.__new__(OccupancyAnalytics)
+        analytics.__init_from_arrays(
+            np.asarray(start_dates, dtype='datetime64[D]'),
+            np.asarray(end_dates, dtype='datetime64[D]')
+        )
+
+        return analytics
+
+    def __init_from_arrays(self, start_dates: np.array, end_dates: np.array) -> None:
+        import numpy as np
+
+        if start_dates.size == 0:
+            raise ValueError('Visits list is empty')
+
+        self.first_day = start_dates.min()
+        self.occupancy = VectorizedVisitorRegistrator.get_daily_occupancy(
+            (start_dates - self.first_day).astype(np.int64),
+            (end_dates - self.first_day).astype(np.int64)
+        )
+        self.__max_days_table = OccupancyAnalytics.__build_sparse_table(self.occupancy)
+
+    def get_histogram(self) -> (np.array, np.array):
+        import numpy as np
+
+        days = self.first_day + np.arange(self.occupancy.size)
+
+        return days, self.occupancy.copy()
+
+    def get_peak(self) -> (str | None, int):
+        return self.get_peak_between(str(self.first_day), str(self.first_day + self.occupancy.size - 1))
+
+    def get_peak_between(self, from_day: str, to_day: str) -> (str | None, int):
+        return self.get_peaks([from_day], [to_day])[0]
+
+    def get_peaks(self, from_days: np.array, to_days: np.array) -> list[(str | None, int)]:
+        import numpy as np
+
+        left = (np.asarray(from_days, dtype='datetime64[D]') - self.first_day).astype(np.int64)
+        right = (np.asarray(to_days, dtype='datetime64[D]') - self.first_day).astype(np.int64)
+
+        is_overlapping = (left <= right) & (right >= 0) & (left < self.occupancy.size)
+        left = np.clip(left, 0, self.occupancy.size - 1)
+        right = np.clip(right, 0, self.occupancy.size - 1)
+
+        max_days = self.__query_max_days(left, right)
+        max_visitors = np.where(is_overlapping, self.occupancy[max_days], 0)
+
+        return [
+            (str(self.first_day + max_day) if visitors > 0 else None, int(visitors))
+            for max_day, visitors in zip(max_days.tolist(), max_visitors.tolist())
+        ]
+
+    def get_periodic_peaks(self, period_days: int) -> list[(str, str | None, int)]:
+        import numpy as np
+
+        if period_days <= 0:
+            raise ValueError('Period must be positive')
+
+        from_days = self.first_day + np.arange(0, self.occupancy.size, period_days)
+        to_days = from_days + (period_days - 1)
+
+        return [
+            (str(from_day), max_day, max_visitors)
+            for from_day, (max_day, max_visitors) in zip(from_days, self.get_peaks(from_days, to_days))
+        ]
+
+    def __query_max_days(self, left: np.array, right: np.array) -> np.array:
+        import numpy as np
+
+        lengths = np.maximum(right - left + 1, 1)
+        levels = np.frexp(lengths)[1] - 1
+
+        left_max_days = self.__max_days_table[levels, left]
+        right_max_days = self.__max_days_table[levels, np.maximum(right - (1 << levels) + 1, left)]
+
+        return np.where(
+            self.occupancy[left_max_days] >= self.occupancy[right_max_days],
+            left_max_days,
+            right_max_days
+        )
+
+    @staticmethod
+    def __build_sparse_table(occupancy: np.array) -> np.array:
+        import numpy as np
+
+        days_count = occupancy.size
+        levels_count = days_count.bit_length()
+
+        table = np.zeros((levels_count, days_count), dtype=np.int64)
+        table[0] = np.arange(days_count)
+
+        for level in range(1, levels_count):
+            half = 1 << (level - 1)
+            width = days_count - (1 << level) + 1
+
+            left_max_days = table[level - 1, :width]
+            right_max_days = table[level - 1, half:half + width]
+
+            table[level, :width] = np.where(
+                occupancy[left_max_days] >= occupancy[right_max_days],
+                left_max_days,
+                right_max_days
+            )
+
+        return table
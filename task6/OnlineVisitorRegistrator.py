@@ -0,0 +1,99 @@
+from datetime import date
+from typing import Optional
+
+class OnlineVisitorRegistrator:
+    IS_ENTERED = 1
+    IS_LEAVE = -1
+
+    def __init__(self, first_day: str, last_day: str):
+        self.first_day = date.fromisoformat(first_day).toordinal()
+        self.days_count = date.fromisoformat(last_day).toordinal() - self.first_day + 1
+
+        if self.days_count <= 0:
+            raise ValueError('Last day must not be earlier than the first day')
+
+        self.__maxima = [0] * (4 * self.days_count)
+        self.__max_days = [0] * (4 * self.days_count)
+        self.__pending = [0] * (4 * self.days_count)
+
+        self.__build(1, 0, self.days_count - 1)
+
+    def add_visit(self, start: str, end: str) -> None:
+        self.__update(start, end, OnlineVisitorRegistrator.IS_ENTERED)
+
+    def remove_visit(self, start: str, end: str) -> None:
+        self.__update(start, end, OnlineVisitorRegistrator.IS_LEAVE)
+
+    def get_peak(self) -> (str | None, int):
+        return self.__format_peak(self.__maxima[1], self.__max_days[1])
+
+    def get_peak_between(self, from_day: str, to_day: str) -> (str | None, int):
+        left, right = self.__get_offsets(from_day, to_day)
+
+        return self.__format_peak(*self.__query(1, 0, self.days_count - 1, left, right))
+
+    def __format_peak(self, max_visitors: int, max_day: int) -> (str | None, int):
+        if max_visitors <= 0:
+            return None, max_visitors
+
+        return date.fromordinal(self.first_day + max_day).isoformat(), max_visitors
+
+    def __get_offsets(self, start: str, end: str) -> (int, int):
+        left = date.fromisoformat(start).toordinal() - self.first_day
+        right = date.fromisoformat(end).toordinal() - self.first_day
+
+        if left < 0 or right >= self.days_count or left > right:
+            raise ValueError(f"Range {start}..{end} is outside of the registrator days")
+
+        return left, right
+
+    def __update(self, start: str, end: str, change: int) -> None:
+        left, right = self.__get_offsets(start, end)
+
+        self.__add(1, 0, self.days_count - 1, left, right, change)
+
+    def __build(self, node: int, low: int, high: int) -> None:
+        self.__max_days[node] = low
+
+        if low == high:
+            return
+
+        middle = (low + high) // 2
+        self.__build(2 * node, low, middle)
+        self.__build(2 * node + 1, middle + 1, high)
+
+    def __add(self, node: int, low: int, high: int, left: int, right: int, change: int) -> None:
+        if right < low or high < left:
+            return
+
+        if left <= low and high <= right:
+            self.__maxima[node] += change
+            self.__pending[node] += change
+            return
+
+        middle = (low + high) // 2
+        self.__add(2 * node, low, middle, left, right, change)
+        self.__add(2 * node + 1, middle + 1, high, left, right, change)
+
+        best_child = 2 * node if self.__maxima[2 * node] >= self.__maxima[2 * node + 1] else 2 * node + 1
+
+        self.__maxima[node] = self.__maxima[best_child] + self.__pending[node]
+        self.__max_days[node] = self.__max_days[best_child]
+
+    def __query(self, node: int, low: int, high: int, left: int, right: int) -> Optional[tuple[int, int]]:
+        if right < low or high < left:
+            return None
+
+        if left <= low and high <= right:
+            return self.__maxima[node], self.__max_days[node]
+
+        middle = (low + high) // 2
+        left_peak = self.__query(2 * node, low, middle, left, right)
+        right_peak = self.__query(2 * node + 1, middle + 1, high, left, right)
+
+        if right_peak is None or (left_peak is not None and left_peak[0] >= right_peak[0]):
+            best_peak = left_peak
+        else:
+            best_peak = right_peak
+
+        return best_peak[0] + self.__pending[node], best_peak[1]
@@ -0,0 +1,30 @@
+import os
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+
+from task6.VisitorRegistrator import VisitorRegistrator
+
+class ParallelVisitorRegistrator:
+
+    @staticmethod
+    def execute(
+            visits: list((str, str)),
+            workers_count: int | None = None,
+            chunks_per_worker: int = 4,
+    ) -> (str | None, int):
+        workers_count = workers_count or os.cpu_count() or 1
+
+        if workers_count == 1:
+            return VisitorRegistrator.execute_stream(visits)
+
+        chunk_size = max(1, -(-len(visits) // (workers_count * chunks_per_worker)))
+        chunks = [visits[i:i + chunk_size] for i in range(0, len(visits), chunk_size)]
+
+        changes = defaultdict(int)
+
+        with ProcessPoolExecutor(workers_count) as executor:
+            for partial_changes in executor.map(VisitorRegistrator.accumulate_changes, chunks):
+                for day, change in partial_changes.items():
+                    changes[day] += change
+
+        return VisitorRegistrator.find_peak(changes)
@@ -0,0 +1,58 @@
+import os
+import random
+import sys
+import time
+from datetime import date, timedelta
+
+from task6.ParallelVisitorRegistrator import ParallelVisitorRegistrator
+from task6.VisitorRegistrator import VisitorRegistrator
+
+class ParallelVisitorRegistratorBenchmark:
+    DEFAULT_VISITS_COUNT: int = 2_000_000
+    DAYS_COUNT: int = 3650
+    MAX_VISIT_DAYS: int = 30
+    DEFAULT_SEED: int = 42
+
+    @staticmethod
+    def generate_visits(visits_count: int, seed: int = DEFAULT_SEED) -> list[(str, str)]:
+        generator = random.Random(seed)
+        first_day = date(2020, 1, 1)
+        visits = []
+
+        for _ in range(visits_count):
+            start = first_day + timedelta(days=generator.randrange(ParallelVisitorRegistratorBenchmark.DAYS_COUNT))
+            end = start + timedelta(days=generator.randrange(ParallelVisitorRegistratorBenchmark.MAX_VISIT_DAYS))
+            visits.append((start.isoformat(), end.isoformat()))
+
+        return visits
+
+    @staticmethod
+    def execute(visits_count: int = DEFAULT_VISITS_COUNT) -> list[(int, float, float)]:
+        visits = ParallelVisitorRegistratorBenchmark.generate_visits(visits_count)
+
+        started_at = time.perf_counter()
+        expected = VisitorRegistrator.execute_stream(visits)
+        serial_seconds = time.perf_counter() - started_at
+
+        results = []
+        workers_count = 1
+
+        while workers_count <= (os.cpu_count() or 1):
+            started_at = time.perf_counter()
+            result = ParallelVisitorRegistrator.execute(visits, workers_count)
+            elapsed_seconds = time.perf_counter() - started_at
+
+            if result != expected:
+                raise ValueError(f"{workers_count} workers returned {result} instead of {expected}")
+
+            results.append((workers_count, elapsed_seconds, serial_seconds / elapsed_seconds))
+            workers_count *= 2
+
+        return results
+
+if __name__ == '__main__':
+    visits_count = int(sys.argv[1]) if len(sys.argv) > 1 else ParallelVisitorRegistratorBenchmark.DEFAULT_VISITS_COUNT
+
+    print(f"{'workers':>8}{'seconds':>10}{'speedup':>10}")
+    for workers_count, elapsed_seconds, speedup in ParallelVisitorRegistratorBenchmark.execute(visits_count):
+        print(f"{workers_count:>8}{elapsed_seconds:>10.2f}{speedup:>10.2f}")
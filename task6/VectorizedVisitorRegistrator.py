@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+class VectorizedVisitorRegistrator:
+
+    @staticmethod
+    def execute(visits: list((str, str))) -> (str | None, int):
+        if not visits:
+            return None, 0
+
+        start_dates, end_dates = zip(*visits)
+
+        return VectorizedVisitorRegistrator.execute_arrays(start_dates, end_dates)
+
+    @staticmethod
+    def execute_arrays(start_dates: np.array, end_dates: np.array) -> (str | None, int):
+        import numpy as np
+
+        start_dates = np.asarray(start_dates, dtype='datetime64[D]')
+        end_dates = np.asarray(end_dates, dtype='datetime64[D]')
+
+        if start_dates.size == 0:
+            return None, 0
+
+        first_day = start_dates.min()
+
+        occupancy = VectorizedVisitorRegistrator.get_daily_occupancy(
+            (start_dates - first_day).astype(np.int64),
+            (end_dates - first_day).astype(np.int64)
+        )
+
+        max_day_offset = int(np.argmax(occupancy))
+
+        return str(first_day + max_day_offset), int(occupancy[max_day_offset])
+
+    @staticmethod
+    def get_daily_occupancy(start_offsets: np.array, end_offsets: np.array) -> np.array:
+        import numpy as np
+
+        leave_offsets = end_offsets + 1
+        days_count = int(leave_offsets.max()) + 1
+
+        changes = np.bincount(start_offsets, minlength=days_count)
+        changes -= np.bincount(leave_offsets, minlength=days_count)
+
+        return np.cumsum(changes)
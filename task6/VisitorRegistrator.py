@@ -1,4 +1,7 @@
-from datetime import datetime, timedelta
+import csv
+from collections import defaultdict
+from collections.abc import Iterable
+from datetime import date, datetime, timedelta
 
 class VisitorRegistrator:
     IS_ENTERED = 1
@@ -28,6 +31,107 @@ class VisitorRegistrator:
 
         return max_day.strftime("%Y-%m-%d"), max_visitors
 
+    @staticmethod
+    def execute_counting_sort(visits: list((str, str))) -> (str | None, int):
+        events = []
+
+        for start, end in visits:
+            events.append((date.fromisoformat(start).toordinal(), VisitorRegistrator.IS_ENTERED))
+            events.append((date.fromisoformat(end).toordinal() + 1, VisitorRegistrator.IS_LEAVE))
+
+        max_visitors = 0
+        current_visitors = 0
+        max_day = None
+
+        for day, change in VisitorRegistrator.counting_sort_events(events):
+            current_visitors += change
+            if current_visitors > max_visitors:
+                max_visitors = current_visitors
+                max_day = day
+
+        if max_day is None:
+            return None, max_visitors
+
+        return date.fromordinal(max_day).isoformat(), max_visitors
+
+    @staticmethod
+    def counting_sort_events(events: list[(int, int)]) -> list[(int, int)]:
+        if not events:
+            return []
+
+        first_day = min(day for day, _ in events)
+        last_day = max(day for day, _ in events)
+
+        # two slots per day keep leaves ahead of entries on the same day
+        slots = [
+            (day - first_day) * 2 + (0 if change == VisitorRegistrator.IS_LEAVE else 1)
+            for day, change in events
+        ]
+
+        positions = [0] * ((last_day - first_day + 1) * 2 + 1)
+        for slot in slots:
+            positions[slot + 1] += 1
+
+        for i in range(1, len(positions)):
+            positions[i] += positions[i - 1]
+
+        sorted_events = [None] * len(events)
+        for event, slot in zip(events, slots):
+            sorted_events[positions[slot]] = event
+            positions[slot] += 1
+
+        return sorted_events
+
+    @staticmethod
+    def execute_stream(visits: Iterable[(str, str)]) -> (str | None, int):
+        return VisitorRegistrator.find_peak(
+            VisitorRegistrator.accumulate_changes(visits)
+        )
+
+    @staticmethod
+    def execute_csv(
+            file_path: str,
+            has_header: bool = False,
+            delimiter: str = ','
+    ) -> (str | None, int):
+        with open(file_path, newline='') as file:
+            rows = csv.reader(file, delimiter=delimiter)
+
+            if has_header:
+                next(rows, None)
+
+            return VisitorRegistrator.execute_stream((row[0], row[1]) for row in rows if row)
+
+    @staticmethod
+    def accumulate_changes(
+            visits: Iterable[(str, str)],
+            changes: dict[int, int] | None = None
+    ) -> dict[int, int]:
+        changes = changes if changes is not None else defaultdict(int)
+
+        for start, end in visits:
+            changes[date.fromisoformat(start).toordinal()] += VisitorRegistrator.IS_ENTERED
+            changes[date.fromisoformat(end).toordinal() + 1] += VisitorRegistrator.IS_LEAVE
+
+        return changes
+
+    @staticmethod
+    def find_peak(changes: dict[int, int]) -> (str | None, int):
+        max_visitors = 0
+        current_visitors = 0
+        max_day = None
+
+        for day in sorted(changes):
+            current_visitors += changes[day]
+            if current_visitors > max_visitors:
+                max_visitors = current_visitors
+                max_day = day
+
+        if max_day is None:
+            return None, max_visitors
+
+        return date.fromordinal(max_day).isoformat(), max_visitors
+
 # visits = [("2024-09-15", "2024-09-15"), ("2024-09-14", "2024-09-21")]
 
 # visits = [
@@ -1,3 +1,5 @@
+from task7.CsrGraph import CsrGraph
+
 class BellmanFordAlgorithm:
     INFINITY = float("Inf")
 
@@ -13,31 +15,191 @@ class BellmanFordAlgorithm:
             start_edge_index,
             is_allow_negative_cycles: bool = True,
     ) -> (list[int], list[int|None]):
+        distances, predecessors, negative_cycle = BellmanFordAlgorithm.__search(
+            vertex_count,
+            start_edge_index,
+            lambda distances, predecessors: BellmanFordAlgorithm.__relax_edges(edges, distances, predecessors),
+            lambda: BellmanFordAlgorithm.__convert_edges_to_targets(vertex_count, edges)
+        )
+
+        BellmanFordAlgorithm.__report_negative_cycle(negative_cycle, is_allow_negative_cycles)
+
+        return distances, predecessors
+
+    @staticmethod
+    def execute_graph(
+            graph: CsrGraph,
+            start_edge_index: int,
+            is_allow_negative_cycles: bool = True,
+    ) -> (list[int], list[int|None]):
+        distances, predecessors, negative_cycle = BellmanFordAlgorithm.__search(
+            graph.vertex_count,
+            start_edge_index,
+            lambda distances, predecessors: BellmanFordAlgorithm.__relax_graph(graph, distances, predecessors),
+            lambda: [graph.targets[graph.offsets[u]:graph.offsets[u + 1]] for u in range(graph.vertex_count)]
+        )
+
+        BellmanFordAlgorithm.__report_negative_cycle(negative_cycle, is_allow_negative_cycles)
+
+        return distances, predecessors
+
+    @staticmethod
+    def find_negative_cycle(
+            vertex_count: int,
+            edges: list[Edge],
+            start_edge_index: int,
+    ) -> list[int] | None:
+        _, _, negative_cycle = BellmanFordAlgorithm.__search(
+            vertex_count,
+            start_edge_index,
+            lambda distances, predecessors: BellmanFordAlgorithm.__relax_edges(edges, distances, predecessors),
+            lambda: BellmanFordAlgorithm.__convert_edges_to_targets(vertex_count, edges)
+        )
+
+        return negative_cycle
+
+    @staticmethod
+    def __search(
+            vertex_count: int,
+            start_edge_index: int,
+            relax,
+            get_targets,
+    ) -> (list[int], list[int|None], list[int] | None):
         distances = [BellmanFordAlgorithm.INFINITY] * vertex_count
         predecessors = [None] * vertex_count
         distances[start_edge_index] = 0
 
-        for i in range(vertex_count - 1):
+        first_negative_cycle = None
+        targets = None
+        rounds_count = 0
+
+        while True:
+            last_relaxed_vertex = relax(distances, predecessors)
+
+            if last_relaxed_vertex is None:
+                return distances, predecessors, first_negative_cycle
+
+            rounds_count += 1
+
+            negative_cycle = None
+
+            # a cycle in the predecessor graph is always negative; walking it after rounds 1, 2, 4, 8...
+            # finds it long before round V while keeping the total walk cost at O(V log V)
+            if rounds_count & (rounds_count - 1) == 0:
+                negative_cycle = BellmanFordAlgorithm.__find_predecessor_cycle(predecessors, distances)
+
+            if negative_cycle is None and rounds_count >= vertex_count:
+                negative_cycle = BellmanFordAlgorithm.__get_cycle_behind(last_relaxed_vertex, predecessors)
+
+            if negative_cycle is not None:
+                first_negative_cycle = first_negative_cycle or negative_cycle
+                targets = targets or get_targets()
+
+                # vertices at -inf stop relaxing, the remaining rounds only look for other cycles
+                BellmanFordAlgorithm.__mark_reachable_as_negative_infinity(negative_cycle, distances, targets)
+
+    @staticmethod
+    def __report_negative_cycle(negative_cycle: list[int] | None, is_allow_negative_cycles: bool) -> None:
+        if negative_cycle is None:
+            return
+
+        if not is_allow_negative_cycles:
+            raise Exception("Negative cycle detected")
+
+        print("Graph contains negative weight cycle!")
+
+    @staticmethod
+    def __relax_edges(edges: list[Edge], distances: list[int], predecessors: list[int|None]) -> int | None:
+        last_relaxed_vertex = None
+
+        for edge in edges:
+            u, v, w = edge.vertex_u, edge.vertex_v, edge.weight
+            if distances[u] != BellmanFordAlgorithm.INFINITY and distances[u] + w < distances[v]:
+                distances[v] = distances[u] + w
+                predecessors[v] = u
+                last_relaxed_vertex = v
 
-            is_updated = False
+        return last_relaxed_vertex
 
-            for edge in edges:
-                u, v, w = edge.vertex_u, edge.vertex_v, edge.weight
-                if distances[u] != BellmanFordAlgorithm.INFINITY and distances[u] + w < distances[v]:
-                    distances[v] = distances[u] + w
+    @staticmethod
+    def __relax_graph(graph: CsrGraph, distances: list[int], predecessors: list[int|None]) -> int | None:
+        offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+        last_relaxed_vertex = None
+
+        for u in range(graph.vertex_count):
+            distance_u = distances[u]
+            if distance_u == BellmanFordAlgorithm.INFINITY:
+                continue
+
+            for position in range(offsets[u], offsets[u + 1]):
+                v = targets[position]
+                if distance_u + weights[position] < distances[v]:
+                    distances[v] = distance_u + weights[position]
                     predecessors[v] = u
-                    is_updated = True
+                    last_relaxed_vertex = v
 
-            if not is_updated:
-                break
+        return last_relaxed_vertex
+
+    @staticmethod
+    def __find_predecessor_cycle(predecessors: list[int|None], distances: list[int]) -> list[int] | None:
+        walk_ids = [None] * len(predecessors)
 
-        if BellmanFordAlgorithm.__edges_has_negative_weight_cycle(edges, distances):
-            if not is_allow_negative_cycles:
-                raise Exception("Negative cycle detected")
+        for walk_start in range(len(predecessors)):
+            vertex = walk_start
 
-            print("Graph contains negative weight cycle!")
+            while vertex is not None and walk_ids[vertex] is None \
+                    and distances[vertex] != -BellmanFordAlgorithm.INFINITY:
+                walk_ids[vertex] = walk_start
+                vertex = predecessors[vertex]
 
-        return distances, predecessors
+            if vertex is not None and walk_ids[vertex] == walk_start:
+                return BellmanFordAlgorithm.__get_cycle_behind(vertex, predecessors)
+
+        return None
+
+    @staticmethod
+    def __get_cycle_behind(vertex: int, predecessors: list[int|None]) -> list[int] | None:
+        for _ in range(len(predecessors)):
+            if vertex is None:
+                return None
+            vertex = predecessors[vertex]
+
+        cycle = [vertex]
+        current = predecessors[vertex]
+
+        while current != vertex:
+            cycle.append(current)
+            current = predecessors[current]
+
+        cycle.reverse()
+
+        return cycle
+
+    @staticmethod
+    def __mark_reachable_as_negative_infinity(
+            negative_cycle: list[int],
+            distances: list[int],
+            targets: list[list[int]],
+    ) -> None:
+        stack = list(negative_cycle)
+
+        for vertex in negative_cycle:
+            distances[vertex] = -BellmanFordAlgorithm.INFINITY
+
+        while stack:
+            for v in targets[stack.pop()]:
+                if distances[v] != -BellmanFordAlgorithm.INFINITY:
+                    distances[v] = -BellmanFordAlgorithm.INFINITY
+                    stack.append(v)
+
+    @staticmethod
+    def __convert_edges_to_targets(vertex_count: int, edges: list[Edge]) -> list[list[int]]:
+        targets = [[] for _ in range(vertex_count)]
+
+        for edge in edges:
+            targets[edge.vertex_u].append(edge.vertex_v)
+
+        return targets
 
     @staticmethod
     def show_path(
@@ -49,6 +211,10 @@ class BellmanFordAlgorithm:
         if distances[target_index] == BellmanFordAlgorithm.INFINITY:
             print(f"path from vertex {source_index} to vertex {target_index} is not exists!")
 
+        if distances[target_index] == -BellmanFordAlgorithm.INFINITY:
+            print(f"path from vertex {source_index} to vertex {target_index} passes through a negative cycle!")
+            return
+
         path = []
         current = target_index
         visited_count = 0
@@ -67,14 +233,6 @@ class BellmanFordAlgorithm:
 
         print(path)
 
-    @staticmethod
-    def __edges_has_negative_weight_cycle(edges: list[Edge], distances: list[int]) -> bool:
-        for edge in edges:
-            u, v, w = edge.vertex_u, edge.vertex_v, edge.weight
-            if distances[u] != BellmanFordAlgorithm.INFINITY and distances[u] + w < distances[v]:
-                return True
-        return False
-
     @staticmethod
     def convert_matrix_to_edges(matrix: list[list[int]]) -> list[Edge]:
         edges = []
@@ -92,30 +250,31 @@ class BellmanFordAlgorithm:
 
         return edges
 
-INF = BellmanFordAlgorithm.INFINITY
+if __name__ == '__main__':
+    INF = BellmanFordAlgorithm.INFINITY
 
-# adjacency_matrix = [
-#     [0, 6, INF, INF, 7],
-#     [INF, 0, 5, -4, 8],
-#     [INF, -2, 0, INF, INF],
-#     [2, INF, 7, 0, INF],
-#     [INF, INF, -3, 9, 0]
-# ]
+    # adjacency_matrix = [
+    #     [0, 6, INF, INF, 7],
+    #     [INF, 0, 5, -4, 8],
+    #     [INF, -2, 0, INF, INF],
+    #     [2, INF, 7, 0, INF],
+    #     [INF, INF, -3, 9, 0]
+    # ]
 
-adjacency_matrix = [
-    [0, 1, INF],
-    [INF, 0, -1],
-    [-1, INF, 0]
-]
+    adjacency_matrix = [
+        [0, 1, INF],
+        [INF, 0, -1],
+        [-1, INF, 0]
+    ]
 
 
-edges = BellmanFordAlgorithm.convert_matrix_to_edges(adjacency_matrix)
+    edges = BellmanFordAlgorithm.convert_matrix_to_edges(adjacency_matrix)
 
-vertex_count = len(adjacency_matrix)
+    vertex_count = len(adjacency_matrix)
 
-distances, predecessors = BellmanFordAlgorithm.execute(vertex_count, edges, start_edge_index=0)
+    distances, predecessors = BellmanFordAlgorithm.execute(vertex_count, edges, start_edge_index=0)
 
-print("Расстояния:", distances)
-print("Предшественники:", predecessors)
+    print("Расстояния:", distances)
+    print("Предшественники:", predecessors)
 
-BellmanFordAlgorithm.show_path(0, 2, distances, predecessors)
+    BellmanFordAlgorithm.show_path(0, 2, distances, predecessors)
@@ -0,0 +1,107 @@
+from array import array
+from collections.abc import Iterable
+
+class CsrGraph:
+    VERTEX_TYPECODE: str = 'q'
+    WEIGHT_TYPECODE: str = 'd'
+
+    vertex_count: int
+    offsets: array
+    targets: array
+    weights: array
+
+    def __init__(self, vertex_count: int, offsets: array, targets: array, weights: array):
+        if len(offsets) != vertex_count + 1:
+            raise ValueError('Offsets must contain vertex_count + 1 elements')
+
+        if len(targets) != len(weights) or offsets[-1] != len(targets):
+            raise ValueError('Targets and weights must contain one element per edge')
+
+        self.vertex_count = vertex_count
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+
+    @property
+    def edge_count(self) -> int:
+        return len(self.targets)
+
+    def get_out_edges(self, vertex: int) -> Iterable[(int, float)]:
+        begin, end = self.offsets[vertex], self.offsets[vertex + 1]
+
+        return zip(self.targets[begin:end], self.weights[begin:end])
+
+    def get_edge_arrays(self) -> (array, array, array):
+        sources = array(CsrGraph.VERTEX_TYPECODE)
+
+        for vertex in range(self.vertex_count):
+            sources.extend([vertex] * (self.offsets[vertex + 1] - self.offsets[vertex]))
+
+        return sources, self.targets, self.weights
+
+    def to_adjacency(self) -> list[list[(int, float)]]:
+        return [list(self.get_out_edges(vertex)) for vertex in range(self.vertex_count)]
+
+    @staticmethod
+    def from_edge_arrays(
+            vertex_count: int,
+            sources: Iterable[int],
+            targets: Iterable[int],
+            weights: Iterable[float],
+    ) -> 'CsrGraph':
+        sources = array(CsrGraph.VERTEX_TYPECODE, sources)
+        targets = array(CsrGraph.VERTEX_TYPECODE, targets)
+        weights = array(CsrGraph.WEIGHT_TYPECODE, weights)
+
+        if not len(sources) == len(targets) == len(weights):
+            raise ValueError('Edge arrays must have equal lengths')
+
+        offsets = array(CsrGraph.VERTEX_TYPECODE, [0]) * (vertex_count + 1)
+
+        for source in sources:
+            if not 0 <= source < vertex_count:
+                raise ValueError(f"Vertex {source} is out of range")
+            offsets[source + 1] += 1
+
+        for vertex in range(vertex_count):
+            offsets[vertex + 1] += offsets[vertex]
+
+        positions = offsets[:-1]
+        sorted_targets = array(CsrGraph.VERTEX_TYPECODE, [0]) * len(targets)
+        sorted_weights = array(CsrGraph.WEIGHT_TYPECODE, [0]) * len(weights)
+
+        for source, target, weight in zip(sources, targets, weights):
+            if not 0 <= target < vertex_count:
+                raise ValueError(f"Vertex {target} is out of range")
+
+            position = positions[source]
+            sorted_targets[position] = target
+            sorted_weights[position] = weight
+            positions[source] = position + 1
+
+        return CsrGraph(vertex_count, offsets, sorted_targets, sorted_weights)
+
+    @staticmethod
+    def from_edges(vertex_count: int, edges: Iterable) -> 'CsrGraph':
+        edges = list(edges)
+
+        return CsrGraph.from_edge_arrays(
+            vertex_count,
+            (edge.vertex_u for edge in edges),
+            (edge.vertex_v for edge in edges),
+            (edge.weight for edge in edges),
+        )
+
+    @staticmethod
+    def from_adjacency(adjacency: list[list[(int, float)]]) -> 'CsrGraph':
+        offsets = array(CsrGraph.VERTEX_TYPECODE, [0])
+        targets = array(CsrGraph.VERTEX_TYPECODE)
+        weights = array(CsrGraph.WEIGHT_TYPECODE)
+
+        for out_edges in adjacency:
+            for target, weight in out_edges:
+                targets.append(target)
+                weights.append(weight)
+            offsets.append(len(targets))
+
+        return CsrGraph(len(adjacency), offsets, targets, weights)
@@ -0,0 +1,138 @@
+from collections import deque
+
+from task7.BellmanFordAlgorithm import BellmanFordAlgorithm
+from task7.SpfaAlgorithm import SpfaAlgorithm
+
+class DynamicBellmanFordAlgorithm:
+    INFINITY = BellmanFordAlgorithm.INFINITY
+
+    distances: list[int]
+    predecessors: list[int|None]
+
+    def __init__(
+            self,
+            vertex_count: int,
+            edges: list[BellmanFordAlgorithm.Edge],
+            start_edge_index: int,
+    ):
+        self.vertex_count = vertex_count
+        self.start_edge_index = start_edge_index
+        self.out_edges: list[dict[int, int]] = [{} for _ in range(vertex_count)]
+        self.in_edges: list[dict[int, int]] = [{} for _ in range(vertex_count)]
+
+        for edge in edges:
+            weight = min(edge.weight, self.out_edges[edge.vertex_u].get(edge.vertex_v, edge.weight))
+            self.out_edges[edge.vertex_u][edge.vertex_v] = weight
+            self.in_edges[edge.vertex_v][edge.vertex_u] = weight
+
+        self.recompute()
+
+    def recompute(self) -> None:
+        self.distances, self.predecessors = SpfaAlgorithm.execute_adjacency(
+            [list(targets.items()) for targets in self.out_edges],
+            self.start_edge_index,
+            is_allow_negative_cycles=False
+        )
+
+    def set_edge(self, vertex_u: int, vertex_v: int, weight: int) -> None:
+        old_weight = self.out_edges[vertex_u].get(vertex_v)
+
+        self.out_edges[vertex_u][vertex_v] = weight
+        self.in_edges[vertex_v][vertex_u] = weight
+
+        try:
+            if old_weight is None or weight < old_weight:
+                self.__propagate_decrease(vertex_u, vertex_v, weight)
+            elif weight > old_weight and self.__is_tree_edge(vertex_u, vertex_v, old_weight):
+                self.__repair_subtree(vertex_v)
+        except Exception:
+            # the update closed a negative cycle: put the old edge back and rebuild the half-propagated distances
+            if old_weight is None:
+                del self.out_edges[vertex_u][vertex_v]
+                del self.in_edges[vertex_v][vertex_u]
+            else:
+                self.out_edges[vertex_u][vertex_v] = old_weight
+                self.in_edges[vertex_v][vertex_u] = old_weight
+
+            self.recompute()
+            raise
+
+    def delete_edge(self, vertex_u: int, vertex_v: int) -> None:
+        old_weight = self.out_edges[vertex_u].pop(vertex_v, None)
+
+        if old_weight is None:
+            raise Exception(f"Edge {vertex_u} -> {vertex_v} is not in the graph.")
+
+        del self.in_edges[vertex_v][vertex_u]
+
+        if self.__is_tree_edge(vertex_u, vertex_v, old_weight):
+            self.__repair_subtree(vertex_v)
+
+    def __is_tree_edge(self, vertex_u: int, vertex_v: int, weight: int) -> bool:
+        return self.predecessors[vertex_v] == vertex_u \
+            and self.distances[vertex_u] + weight == self.distances[vertex_v]
+
+    def __propagate_decrease(self, vertex_u: int, vertex_v: int, weight: int) -> None:
+        if self.distances[vertex_u] == DynamicBellmanFordAlgorithm.INFINITY \
+                or self.distances[vertex_u] + weight >= self.distances[vertex_v]:
+            return
+
+        self.distances[vertex_v] = self.distances[vertex_u] + weight
+        self.predecessors[vertex_v] = vertex_u
+
+        self.__propagate([vertex_v])
+
+    def __repair_subtree(self, root: int) -> None:
+        subtree = [root]
+        is_affected = {root}
+
+        for vertex in subtree:
+            for child in self.out_edges[vertex]:
+                if child not in is_affected and self.predecessors[child] == vertex:
+                    is_affected.add(child)
+                    subtree.append(child)
+
+        for vertex in subtree:
+            self.distances[vertex] = DynamicBellmanFordAlgorithm.INFINITY
+            self.predecessors[vertex] = None
+
+        # affected vertices restart from their best in-edge outside the invalidated subtree
+        for vertex in subtree:
+            for parent, weight in self.in_edges[vertex].items():
+                if parent in is_affected or self.distances[parent] == DynamicBellmanFordAlgorithm.INFINITY:
+                    continue
+
+                if self.distances[parent] + weight < self.distances[vertex]:
+                    self.distances[vertex] = self.distances[parent] + weight
+                    self.predecessors[vertex] = parent
+
+        self.__propagate([vertex for vertex in subtree if self.distances[vertex] != DynamicBellmanFordAlgorithm.INFINITY])
+
+    def __propagate(self, seeds: list[int]) -> None:
+        queue = deque(seeds)
+        is_queued = [False] * self.vertex_count
+        relaxations_counts = [0] * self.vertex_count
+
+        for vertex in seeds:
+            is_queued[vertex] = True
+
+        while queue:
+            u = queue.popleft()
+            is_queued[u] = False
+
+            for v, w in self.out_edges[u].items():
+                if self.distances[u] + w >= self.distances[v]:
+                    continue
+
+                self.distances[v] = self.distances[u] + w
+                self.predecessors[v] = u
+                relaxations_counts[v] += 1
+
+                # a vertex improved V times means a negative cycle: let the full run report it
+                if relaxations_counts[v] >= self.vertex_count:
+                    self.recompute()
+                    return
+
+                if not is_queued[v]:
+                    is_queued[v] = True
+                    queue.append(v)
@@ -0,0 +1,60 @@
+from array import array
+
+from task7.CsrGraph import CsrGraph
+
+class EdgeListLoader:
+    COMMENT_PREFIXES: tuple[str, ...] = ('#', '%')
+
+    @staticmethod
+    def load_text(
+            file_path: str,
+            vertex_count: int | None = None,
+            delimiter: str | None = None,
+    ) -> CsrGraph:
+        sources = array(CsrGraph.VERTEX_TYPECODE)
+        targets = array(CsrGraph.VERTEX_TYPECODE)
+        weights = array(CsrGraph.WEIGHT_TYPECODE)
+
+        with open(file_path) as file:
+            for line in file:
+                line = line.strip()
+
+                if not line or line.startswith(EdgeListLoader.COMMENT_PREFIXES):
+                    continue
+
+                source, target, weight = line.split(delimiter)[:3]
+                sources.append(int(source))
+                targets.append(int(target))
+                weights.append(float(weight))
+
+        if vertex_count is None:
+            vertex_count = max(max(sources, default=-1), max(targets, default=-1)) + 1
+
+        return CsrGraph.from_edge_arrays(vertex_count, sources, targets, weights)
+
+    @staticmethod
+    def load_binary(file_path: str) -> CsrGraph:
+        with open(file_path, 'rb') as file:
+            header = array(CsrGraph.VERTEX_TYPECODE)
+            header.fromfile(file, 2)
+            vertex_count, edge_count = header
+
+            sources = array(CsrGraph.VERTEX_TYPECODE)
+            targets = array(CsrGraph.VERTEX_TYPECODE)
+            weights = array(CsrGraph.WEIGHT_TYPECODE)
+
+            sources.fromfile(file, edge_count)
+            targets.fromfile(file, edge_count)
+            weights.fromfile(file, edge_count)
+
+        return CsrGraph.from_edge_arrays(vertex_count, sources, targets, weights)
+
+    @staticmethod
+    def save_binary(file_path: str, graph: CsrGraph) -> None:
+        sources, targets, weights = graph.get_edge_arrays()
+
+        with open(file_path, 'wb') as file:
+            array(CsrGraph.VERTEX_TYPECODE, [graph.vertex_count, graph.edge_count]).tofile(file)
+            sources.tofile(file)
+            targets.tofile(file)
+            weights.tofile(file)
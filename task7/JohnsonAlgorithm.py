@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import heapq
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+from task7.CsrGraph import CsrGraph
+from task7.SpfaAlgorithm import SpfaAlgorithm
+
+class JohnsonAlgorithm:
+    INFINITY = SpfaAlgorithm.INFINITY
+    DEFAULT_SOURCES_PER_TASK: int = 64
+
+    _worker_graph: CsrGraph | None = None
+    _worker_potentials: array | None = None
+
+    @staticmethod
+    def execute(
+            graph: CsrGraph,
+            sources: list[int] | None = None,
+            workers_count: int | None = None,
+            memmap_path: str | None = None,
+            dtype: np.dtype = 'float64',
+    ) -> np.array:
+        import numpy as np
+
+        sources = list(range(graph.vertex_count)) if sources is None else list(sources)
+        workers_count = workers_count or os.cpu_count() or 1
+
+        potentials = JohnsonAlgorithm.get_potentials(graph)
+        reweighted_graph = JohnsonAlgorithm.reweight(graph, potentials)
+
+        shape = (len(sources), graph.vertex_count)
+
+        if memmap_path is not None:
+            distances = np.lib.format.open_memmap(memmap_path, mode='w+', dtype=dtype, shape=shape)
+        else:
+            distances = np.empty(shape, dtype=dtype)
+
+        chunks = [
+            (position, sources[position:position + JohnsonAlgorithm.DEFAULT_SOURCES_PER_TASK])
+            for position in range(0, len(sources), JohnsonAlgorithm.DEFAULT_SOURCES_PER_TASK)
+        ]
+
+        if workers_count == 1:
+            JohnsonAlgorithm._init_worker(reweighted_graph, potentials)
+
+            try:
+                for position, chunk in chunks:
+                    distances[position:position + len(chunk)] = JohnsonAlgorithm._solve_chunk(chunk)
+            finally:
+                JohnsonAlgorithm._init_worker(None, None)
+        else:
+            with ProcessPoolExecutor(
+                    workers_count,
+                    initializer=JohnsonAlgorithm._init_worker,
+                    initargs=(reweighted_graph, potentials)
+            ) as executor:
+                chunks_rows = executor.map(JohnsonAlgorithm._solve_chunk, [chunk for _, chunk in chunks])
+
+                for (position, chunk), rows in zip(chunks, chunks_rows):
+                    distances[position:position + len(chunk)] = rows
+
+        if memmap_path is not None:
+            distances.flush()
+
+        return distances
+
+    @staticmethod
+    def get_potentials(graph: CsrGraph) -> array:
+        virtual_source = graph.vertex_count
+
+        offsets = array(CsrGraph.VERTEX_TYPECODE, graph.offsets)
+        offsets.append(graph.edge_count + graph.vertex_count)
+
+        targets = array(CsrGraph.VERTEX_TYPECODE, graph.targets)
+        targets.extend(range(graph.vertex_count))
+
+        weights = array(CsrGraph.WEIGHT_TYPECODE, graph.weights)
+        weights.extend([0] * graph.vertex_count)
+
+        distances, _ = SpfaAlgorithm.execute_graph(
+            CsrGraph(graph.vertex_count + 1, offsets, targets, weights),
+            virtual_source,
+            is_allow_negative_cycles=False
+        )
+
+        return array(CsrGraph.WEIGHT_TYPECODE, distances[:virtual_source])
+
+    @staticmethod
+    def reweight(graph: CsrGraph, potentials: array) -> CsrGraph:
+        weights = array(CsrGraph.WEIGHT_TYPECODE, graph.weights)
+
+        for u in range(graph.vertex_count):
+            for position in range(graph.offsets[u], graph.offsets[u + 1]):
+                weights[position] = max(0.0, weights[position] + potentials[u] - potentials[graph.targets[position]])
+
+        return CsrGraph(graph.vertex_count, graph.offsets, graph.targets, weights)
+
+    @staticmethod
+    def dijkstra(graph: CsrGraph, source: int) -> list[float]:
+        offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+
+        distances = [JohnsonAlgorithm.INFINITY] * graph.vertex_count
+        distances[source] = 0
+        heap = [(0, source)]
+
+        while heap:
+            distance_u, u = heapq.heappop(heap)
+
+            if distance_u > distances[u]:
+                continue
+
+            for position in range(offsets[u], offsets[u + 1]):
+                v = targets[position]
+                candidate = distance_u + weights[position]
+
+                if candidate < distances[v]:
+                    distances[v] = candidate
+                    heapq.heappush(heap, (candidate, v))
+
+        return distances
+
+    # worker entry points stay single-underscored: name-mangled methods cannot be pickled by the pool
+    @staticmethod
+    def _init_worker(graph: CsrGraph, potentials: array) -> None:
+        JohnsonAlgorithm._worker_graph = graph
+        JohnsonAlgorithm._worker_potentials = potentials
+
+    @staticmethod
+    def _solve_chunk(sources: list[int]) -> np.array:
+        import numpy as np
+
+        graph = JohnsonAlgorithm._worker_graph
+        potentials = np.frombuffer(JohnsonAlgorithm._worker_potentials, dtype=np.float64)
+
+        rows = np.empty((len(sources), graph.vertex_count))
+
+        for row, source in enumerate(sources):
+            rows[row] = JohnsonAlgorithm.dijkstra(graph, source)
+            rows[row] += potentials - potentials[source]
+
+        return rows
@@ -0,0 +1,101 @@
+from collections import deque
+
+from task7.BellmanFordAlgorithm import BellmanFordAlgorithm
+from task7.CsrGraph import CsrGraph
+
+class SpfaAlgorithm:
+    INFINITY = BellmanFordAlgorithm.INFINITY
+
+    @staticmethod
+    def execute(
+            vertex_count: int,
+            edges: list[BellmanFordAlgorithm.Edge],
+            start_edge_index,
+            is_allow_negative_cycles: bool = True,
+    ) -> (list[int], list[int|None]):
+        return SpfaAlgorithm.execute_graph(
+            CsrGraph.from_edges(vertex_count, edges),
+            start_edge_index,
+            is_allow_negative_cycles
+        )
+
+    @staticmethod
+    def execute_adjacency(
+            adjacency: list[list[(int, int)]],
+            start_edge_index: int,
+            is_allow_negative_cycles: bool = True,
+    ) -> (list[int], list[int|None]):
+        return SpfaAlgorithm.execute_graph(
+            CsrGraph.from_adjacency(adjacency),
+            start_edge_index,
+            is_allow_negative_cycles
+        )
+
+    @staticmethod
+    def execute_graph(
+            graph: CsrGraph,
+            start_edge_index: int,
+            is_allow_negative_cycles: bool = True,
+    ) -> (list[int], list[int|None]):
+        vertex_count = graph.vertex_count
+        offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+
+        distances = [SpfaAlgorithm.INFINITY] * vertex_count
+        predecessors = [None] * vertex_count
+        path_lengths = [0] * vertex_count
+        is_queued = [False] * vertex_count
+
+        distances[start_edge_index] = 0
+        queue = deque([start_edge_index])
+        is_queued[start_edge_index] = True
+        queued_distances_sum = 0
+
+        while queue:
+            # Large Label Last: postpone vertices whose distance is above the queue average
+            average_distance = queued_distances_sum / len(queue)
+            for _ in range(len(queue) - 1):
+                if distances[queue[0]] <= average_distance:
+                    break
+                queue.append(queue.popleft())
+
+            u = queue.popleft()
+            is_queued[u] = False
+            queued_distances_sum -= distances[u]
+
+            distance_u = distances[u]
+
+            for position in range(offsets[u], offsets[u + 1]):
+                v = targets[position]
+                candidate = distance_u + weights[position]
+
+                if candidate >= distances[v]:
+                    continue
+
+                if is_queued[v]:
+                    queued_distances_sum += candidate - distances[v]
+
+                distances[v] = candidate
+                predecessors[v] = u
+                path_lengths[v] = path_lengths[u] + 1
+
+                if path_lengths[v] >= vertex_count:
+                    if not is_allow_negative_cycles:
+                        raise Exception("Negative cycle detected")
+
+                    print("Graph contains negative weight cycle!")
+
+                    return distances, predecessors
+
+                if is_queued[v]:
+                    continue
+
+                # Small Label First: a vertex better than the queue head is processed next
+                if queue and candidate < distances[queue[0]]:
+                    queue.appendleft(v)
+                else:
+                    queue.append(v)
+
+                is_queued[v] = True
+                queued_distances_sum += candidate
+
+        return distances, predecessors
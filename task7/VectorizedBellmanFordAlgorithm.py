@@ -0,0 +1,288 @@
+from __future__ import annotations
+
+from task7.BellmanFordAlgorithm import BellmanFordAlgorithm
+from task7.CsrGraph import CsrGraph
+
+class VectorizedBellmanFordAlgorithm:
+    INFINITY = BellmanFordAlgorithm.INFINITY
+    NO_PREDECESSOR = -1
+    BLOCK_BYTES: int = 1 << 20
+    SOURCES_PER_BLOCK: int = 64
+
+    @staticmethod
+    def convert_edges_to_arrays(edges: list[BellmanFordAlgorithm.Edge]) -> (np.array, np.array, np.array):
+        import numpy as np
+
+        vertices_u = np.fromiter((edge.vertex_u for edge in edges), dtype=np.int64, count=len(edges))
+        vertices_v = np.fromiter((edge.vertex_v for edge in edges), dtype=np.int64, count=len(edges))
+        weights = np.fromiter((edge.weight for edge in edges), dtype=np.float64, count=len(edges))
+
+        return vertices_u, vertices_v, weights
+
+    @staticmethod
+    def convert_graph_to_arrays(graph: CsrGraph) -> (np.array, np.array, np.array):
+        import numpy as np
+
+        offsets = np.frombuffer(graph.offsets, dtype=np.int64)
+
+        return (
+            np.repeat(np.arange(graph.vertex_count, dtype=np.int64), np.diff(offsets)),
+            np.frombuffer(graph.targets, dtype=np.int64),
+            np.frombuffer(graph.weights, dtype=np.float64),
+        )
+
+    @staticmethod
+    def execute_graph(
+            graph: CsrGraph,
+            start_edge_index: int,
+            is_allow_negative_cycles: bool = True,
+    ) -> (np.array, np.array):
+        return VectorizedBellmanFordAlgorithm.execute(
+            graph.vertex_count,
+            *VectorizedBellmanFordAlgorithm.convert_graph_to_arrays(graph),
+            start_edge_index,
+            is_allow_negative_cycles
+        )
+
+    @staticmethod
+    def execute(
+            vertex_count: int,
+            vertices_u: np.array,
+            vertices_v: np.array,
+            weights: np.array,
+            start_edge_index: int,
+            is_allow_negative_cycles: bool = True,
+    ) -> (np.array, np.array):
+        import numpy as np
+
+        vertices_u = np.asarray(vertices_u, dtype=np.int64)
+        vertices_v = np.asarray(vertices_v, dtype=np.int64)
+        weights = np.asarray(weights, dtype=np.float64)
+
+        distances = np.full(vertex_count, VectorizedBellmanFordAlgorithm.INFINITY)
+        predecessors = np.full(vertex_count, VectorizedBellmanFordAlgorithm.NO_PREDECESSOR, dtype=np.int64)
+        distances[start_edge_index] = 0
+
+        for i in range(vertex_count - 1):
+            if not VectorizedBellmanFordAlgorithm.__relax(distances, predecessors, vertices_u, vertices_v, weights):
+                break
+        else:
+            if VectorizedBellmanFordAlgorithm.__relax(distances, predecessors, vertices_u, vertices_v, weights):
+                if not is_allow_negative_cycles:
+                    raise Exception("Negative cycle detected")
+
+                print("Graph contains negative weight cycle!")
+
+        return distances, predecessors
+
+    @staticmethod
+    def execute_many(
+            vertex_count: int,
+            vertices_u: np.array,
+            vertices_v: np.array,
+            weights: np.array,
+            sources: list[int],
+            is_allow_negative_cycles: bool = True,
+    ) -> (np.array, np.array):
+        import numpy as np
+
+        sources = np.asarray(sources, dtype=np.int64)
+
+        # edges grouped by target let one reduceat take the minimum over each target for every source at once
+        order = np.argsort(np.asarray(vertices_v, dtype=np.int64), kind='stable')
+        vertices_u = np.asarray(vertices_u, dtype=np.int64)[order]
+        vertices_v = np.asarray(vertices_v, dtype=np.int64)[order]
+        weights = np.asarray(weights, dtype=np.float64)[order]
+
+        # a (source x edge) chunk of candidates stays within BLOCK_BYTES however large the graph is
+        block_size = min(max(sources.size, 1), VectorizedBellmanFordAlgorithm.SOURCES_PER_BLOCK)
+        chunk_size = max(1, VectorizedBellmanFordAlgorithm.BLOCK_BYTES // (8 * block_size))
+
+        distances = np.empty((sources.size, vertex_count))
+        predecessors = np.empty((sources.size, vertex_count), dtype=np.int64)
+        has_negative_cycle = False
+
+        for block_start in range(0, sources.size, block_size):
+            block = slice(block_start, block_start + block_size)
+
+            block_distances, block_predecessors, block_has_negative_cycle = VectorizedBellmanFordAlgorithm.__execute_block(
+                vertex_count,
+                vertices_u,
+                vertices_v,
+                weights,
+                sources[block],
+                chunk_size
+            )
+
+            distances[block] = block_distances
+            predecessors[block] = block_predecessors
+            has_negative_cycle = has_negative_cycle or block_has_negative_cycle
+
+        if has_negative_cycle:
+            if not is_allow_negative_cycles:
+                raise Exception("Negative cycle detected")
+
+            print("Graph contains negative weight cycle!")
+
+        return distances, predecessors
+
+    @staticmethod
+    def __execute_block(
+            vertex_count: int,
+            vertices_u: np.array,
+            vertices_v: np.array,
+            weights: np.array,
+            sources: np.array,
+            chunk_size: int,
+    ) -> (np.array, np.array, bool):
+        import numpy as np
+
+        # vertex-major (vertex x source) layout: gathering one edge end reads one contiguous row for all sources
+        distances = np.full((vertex_count, sources.size), VectorizedBellmanFordAlgorithm.INFINITY)
+        predecessors = np.full(
+            (vertex_count, sources.size),
+            VectorizedBellmanFordAlgorithm.NO_PREDECESSOR,
+            dtype=np.int64
+        )
+        distances[sources, np.arange(sources.size)] = 0
+
+        active_columns = np.arange(sources.size)
+        is_vertex_changed = np.zeros(vertex_count, dtype=bool)
+        is_vertex_changed[sources] = True
+
+        for i in range(vertex_count):
+            # only edges leaving a vertex that improved in the last round can improve anything now
+            active_edges = np.flatnonzero(is_vertex_changed[vertices_u])
+            is_compacted = active_columns.size < sources.size
+
+            active_distances = distances[:, active_columns] if is_compacted else distances
+            active_predecessors = predecessors[:, active_columns] if is_compacted else predecessors
+
+            is_column_improved, is_vertex_changed = VectorizedBellmanFordAlgorithm.__relax_many(
+                active_distances,
+                active_predecessors,
+                vertices_u[active_edges],
+                vertices_v[active_edges],
+                weights[active_edges],
+                chunk_size
+            )
+
+            if is_compacted:
+                distances[:, active_columns] = active_distances
+                predecessors[:, active_columns] = active_predecessors
+
+            if i == vertex_count - 1:
+                return distances.T, predecessors.T, bool(is_column_improved.any())
+
+            # sources that settled stop costing edge scans while the rest of the block keeps relaxing
+            active_columns = active_columns[is_column_improved]
+
+            if active_columns.size == 0:
+                break
+
+        return distances.T, predecessors.T, False
+
+    @staticmethod
+    def __split_by_target(vertices_v: np.array, chunk_size: int) -> list[(int, int, np.array, np.array)]:
+        import numpy as np
+
+        chunks = []
+
+        for start in range(0, vertices_v.size, chunk_size):
+            chunk_targets = vertices_v[start:start + chunk_size]
+            group_starts = np.flatnonzero(np.r_[True, chunk_targets[1:] != chunk_targets[:-1]])
+
+            chunks.append((start, start + chunk_targets.size, group_starts, chunk_targets[group_starts]))
+
+        return chunks
+
+    @staticmethod
+    def execute_graph_many(
+            graph: CsrGraph,
+            sources: list[int],
+            is_allow_negative_cycles: bool = True,
+    ) -> (np.array, np.array):
+        return VectorizedBellmanFordAlgorithm.execute_many(
+            graph.vertex_count,
+            *VectorizedBellmanFordAlgorithm.convert_graph_to_arrays(graph),
+            sources,
+            is_allow_negative_cycles
+        )
+
+    @staticmethod
+    def __relax_many(
+            distances: np.array,
+            predecessors: np.array,
+            vertices_u: np.array,
+            vertices_v: np.array,
+            weights: np.array,
+            chunk_size: int,
+    ) -> (np.array, np.array):
+        import numpy as np
+
+        chunks = VectorizedBellmanFordAlgorithm.__split_by_target(vertices_v, chunk_size)
+        relaxed_distances = distances.copy()
+
+        # every edge gather is shared by all sources of the block; all chunks read the distances of the last round
+        for start, end, group_starts, targets in chunks:
+            candidates = distances[vertices_u[start:end]]
+            candidates += weights[start:end, None]
+
+            relaxed_distances[targets] = np.minimum(
+                relaxed_distances[targets],
+                np.minimum.reduceat(candidates, group_starts, axis=0)
+            )
+
+        is_improved = relaxed_distances < distances
+        is_vertex_improved = is_improved.any(axis=1)
+
+        if not is_vertex_improved.any():
+            return np.zeros(distances.shape[1], dtype=bool), is_vertex_improved
+
+        for start, end, _, _ in chunks:
+            chunk_targets = vertices_v[start:end]
+            improving_edges = np.flatnonzero(is_vertex_improved[chunk_targets])
+
+            if improving_edges.size == 0:
+                continue
+
+            edge_targets = chunk_targets[improving_edges]
+            edge_sources = vertices_u[start:end][improving_edges]
+
+            candidates = distances[edge_sources]
+            candidates += weights[start:end][improving_edges, None]
+
+            edges, columns = np.nonzero(
+                is_improved[edge_targets] & (candidates == relaxed_distances[edge_targets])
+            )
+            predecessors[edge_targets[edges], columns] = edge_sources[edges]
+
+        distances[:] = relaxed_distances
+
+        return is_improved.any(axis=0), is_vertex_improved
+
+    @staticmethod
+    def __relax(
+            distances: np.array,
+            predecessors: np.array,
+            vertices_u: np.array,
+            vertices_v: np.array,
+            weights: np.array,
+    ) -> bool:
+        import numpy as np
+
+        candidates = distances[vertices_u] + weights
+
+        relaxed_distances = distances.copy()
+        np.minimum.at(relaxed_distances, vertices_v, candidates)
+
+        is_improved = relaxed_distances < distances
+
+        if not is_improved.any():
+            return False
+
+        improving_edges = is_improved[vertices_v] & (candidates == relaxed_distances[vertices_v])
+        predecessors[vertices_v[improving_edges]] = vertices_u[improving_edges]
+        distances[:] = relaxed_distances
+
+        return True
@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from task8.JonkerVolgenantAlgorithm import JonkerVolgenantAlgorithm
+
+class BatchAssignmentAlgorithm:
+    SMALL_PROBLEM_SIZE: int = 128 * 128
+    DEFAULT_CHUNKS_PER_WORKER: int = 4
+
+    _worker_memory: shared_memory.SharedMemory | None = None
+    _worker_cost_matrices: np.array = None
+
+    @staticmethod
+    def solve_batch(
+            weight_matrices: np.array,
+            is_maximization: bool = False,
+            workers_count: int | None = None,
+    ) -> (np.array, np.array):
+        import numpy as np
+
+        weight_matrices = np.asarray(weight_matrices)
+
+        if weight_matrices.ndim != 3:
+            raise ValueError("Matrices must be stacked into a three-dimensional array!")
+
+        problems_count, rows_count, columns_count = weight_matrices.shape
+
+        # no problems or nothing to assign, the same answer JonkerVolgenantAlgorithm.solve gives per problem
+        if problems_count == 0 or rows_count == 0 or columns_count == 0:
+            return np.full((problems_count, rows_count), -1, dtype=np.int64), np.zeros(problems_count)
+
+        cost_matrices = -weight_matrices if is_maximization else weight_matrices
+        cost_matrices = np.where(np.isfinite(cost_matrices), cost_matrices, np.inf).astype(np.float64, copy=False)
+
+        if rows_count * columns_count <= BatchAssignmentAlgorithm.SMALL_PROBLEM_SIZE or problems_count == 1:
+            row_columns = BatchAssignmentAlgorithm.get_assigned_columns(cost_matrices)
+        else:
+            row_columns = BatchAssignmentAlgorithm.__solve_in_pool(cost_matrices, workers_count)
+
+        problems = np.arange(problems_count)[:, None]
+        is_assigned = row_columns >= 0
+
+        total_costs = np.where(
+            is_assigned,
+            weight_matrices[problems, np.arange(rows_count), np.maximum(row_columns, 0)],
+            0
+        ).sum(axis=1, dtype=np.float64)
+
+        return row_columns, total_costs
+
+    @staticmethod
+    def get_assigned_columns(cost_matrices: np.array) -> np.array:
+        import numpy as np
+
+        problems_count, rows_count, columns_count = cost_matrices.shape
+
+        if rows_count > columns_count:
+            assigned_rows = BatchAssignmentAlgorithm.get_assigned_columns(cost_matrices.transpose(0, 2, 1))
+
+            row_columns = np.full((problems_count, rows_count), -1, dtype=np.int64)
+            row_columns[np.arange(problems_count)[:, None], assigned_rows] = np.arange(columns_count)
+
+            return row_columns
+
+        # the same shortest augmenting path as JonkerVolgenantAlgorithm, run in lockstep over all problems;
+        # a problem whose path is complete just drops out of the active set until the next row starts
+        row_potentials = np.zeros((problems_count, rows_count + 1))
+        column_potentials = np.zeros((problems_count, columns_count + 1))
+        column_rows = np.zeros((problems_count, columns_count + 1), dtype=np.int64)
+        previous_columns = np.zeros((problems_count, columns_count + 1), dtype=np.int64)
+
+        for row in range(1, rows_count + 1):
+            column_rows[:, 0] = row
+            current_columns = np.zeros(problems_count, dtype=np.int64)
+
+            min_reduced_costs = np.full((problems_count, columns_count + 1), np.inf)
+            is_visited = np.zeros((problems_count, columns_count + 1), dtype=bool)
+
+            active = np.arange(problems_count)
+
+            while active.size:
+                active_columns = current_columns[active]
+                is_visited[active, active_columns] = True
+                current_rows = column_rows[active, active_columns]
+
+                visited = is_visited[active, 1:]
+                min_costs = min_reduced_costs[active, 1:]
+
+                reduced_costs = cost_matrices[active, current_rows - 1]
+                reduced_costs -= row_potentials[active, current_rows][:, None]
+                reduced_costs -= column_potentials[active, 1:]
+
+                is_improved = ~visited & (reduced_costs < min_costs)
+                min_costs = np.where(is_improved, reduced_costs, min_costs)
+                previous_columns[active, 1:] = np.where(is_improved, active_columns[:, None], previous_columns[active, 1:])
+
+                candidate_costs = np.where(visited, np.inf, min_costs)
+                next_columns = np.argmin(candidate_costs, axis=1)
+                deltas = candidate_costs[np.arange(active.size), next_columns]
+                next_columns += 1
+
+                if np.isinf(deltas).any():
+                    raise ValueError("No feasible assignment avoids the forbidden pairs!")
+
+                # visited columns hold distinct rows, so the fancy-indexed update never collides
+                visited_problems, visited_columns = np.nonzero(is_visited[active])
+                row_potentials[active[visited_problems], column_rows[active[visited_problems], visited_columns]] \
+                    += deltas[visited_problems]
+
+                column_potentials[active] -= np.where(is_visited[active], deltas[:, None], 0)
+                min_reduced_costs[active, 1:] = np.where(visited, min_costs, min_costs - deltas[:, None])
+
+                current_columns[active] = next_columns
+                active = active[column_rows[active, next_columns] != 0]
+
+            augmenting = np.flatnonzero(current_columns)
+
+            while augmenting.size:
+                columns = current_columns[augmenting]
+                previous = previous_columns[augmenting, columns]
+                column_rows[augmenting, columns] = column_rows[augmenting, previous]
+                current_columns[augmenting] = previous
+                augmenting = augmenting[previous != 0]
+
+        problems, columns = np.nonzero(column_rows[:, 1:])
+
+        row_columns = np.empty((problems_count, rows_count), dtype=np.int64)
+        row_columns[problems, column_rows[problems, columns + 1] - 1] = columns
+
+        return row_columns
+
+    @staticmethod
+    def __solve_in_pool(cost_matrices: np.array, workers_count: int | None) -> np.array:
+        import numpy as np
+
+        workers_count = workers_count or os.cpu_count() or 1
+        problems_count = cost_matrices.shape[0]
+
+        chunk_size = max(1, -(-problems_count // (workers_count * BatchAssignmentAlgorithm.DEFAULT_CHUNKS_PER_WORKER)))
+        chunks = [
+            (position, min(position + chunk_size, problems_count))
+            for position in range(0, problems_count, chunk_size)
+        ]
+
+        if workers_count == 1:
+            BatchAssignmentAlgorithm._worker_cost_matrices = cost_matrices
+
+            try:
+                return np.concatenate([BatchAssignmentAlgorithm._solve_chunk(chunk) for chunk in chunks])
+            finally:
+                BatchAssignmentAlgorithm._worker_cost_matrices = None
+
+        # the workers map the stacked matrices instead of receiving a pickled copy per task
+        memory = shared_memory.SharedMemory(create=True, size=cost_matrices.nbytes)
+
+        try:
+            np.ndarray(cost_matrices.shape, dtype=np.float64, buffer=memory.buf)[:] = cost_matrices
+
+            with ProcessPoolExecutor(
+                    workers_count,
+                    initializer=BatchAssignmentAlgorithm._init_worker,
+                    initargs=(memory.name, cost_matrices.shape)
+            ) as executor:
+                return np.concatenate(list(executor.map(BatchAssignmentAlgorithm._solve_chunk, chunks)))
+        finally:
+            memory.close()
+            memory.unlink()
+
+    @staticmethod
+    def _init_worker(memory_name: str, shape: tuple[int, int, int]) -> None:
+        import numpy as np
+
+        BatchAssignmentAlgorithm._worker_memory = shared_memory.SharedMemory(name=memory_name)
+        BatchAssignmentAlgorithm._worker_cost_matrices = np.ndarray(
+            shape,
+            dtype=np.float64,
+            buffer=BatchAssignmentAlgorithm._worker_memory.buf
+        )
+
+    @staticmethod
+    def _solve_chunk(chunk: tuple[int, int]) -> np.array:
+        import numpy as np
+
+        cost_matrices = BatchAssignmentAlgorithm._worker_cost_matrices
+        _, rows_count, _ = cost_matrices.shape
+
+        row_columns = np.empty((chunk[1] - chunk[0], rows_count), dtype=np.int64)
+
+        for position, problem in enumerate(range(*chunk)):
+            assigned_rows, assigned_columns = JonkerVolgenantAlgorithm.get_assignment(cost_matrices[problem])
+
+            row_columns[position] = -1
+            row_columns[position, assigned_rows] = assigned_columns
+
+        return row_columns
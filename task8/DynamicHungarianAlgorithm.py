@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+from task8.JonkerVolgenantAlgorithm import JonkerVolgenantAlgorithm
+
+class DynamicHungarianAlgorithm:
+    weight_matrix: np.array
+    cost_matrix: np.array
+
+    def __init__(self, weight_matrix: np.array, is_maximization: bool = False):
+        import numpy as np
+
+        self.weight_matrix = np.array(weight_matrix, dtype=np.float64)
+
+        if self.weight_matrix.ndim != 2 or self.weight_matrix.shape[0] != self.weight_matrix.shape[1]:
+            raise ValueError("Matrix must be square!")
+
+        self.is_maximization = is_maximization
+        self.size = self.weight_matrix.shape[0]
+        self.cost_matrix = self.__get_costs(self.weight_matrix)
+
+        self.__pending_rows: set[int] = set()
+        self.__pending_columns: set[int] = set()
+
+        self.__reset()
+
+    def solve(self) -> (np.array, float):
+        import numpy as np
+
+        try:
+            self.__repair()
+        except ValueError:
+            # a repair cut short leaves freed rows behind, the next solve starts over instead
+            self.__reset()
+            raise
+
+        row_columns = np.empty(self.size, dtype=np.int64)
+        row_columns[self.column_rows[1:] - 1] = np.arange(self.size)
+
+        total_cost = self.weight_matrix[np.arange(self.size), row_columns].sum()
+
+        return row_columns, float(total_cost)
+
+    def set_row(self, row: int, weights: np.array) -> None:
+        self.weight_matrix[row] = weights
+        self.cost_matrix[row] = self.__get_costs(self.weight_matrix[row])
+        self.__pending_rows.add(row)
+
+    def set_column(self, column: int, weights: np.array) -> None:
+        self.weight_matrix[:, column] = weights
+        self.cost_matrix[:, column] = self.__get_costs(self.weight_matrix[:, column])
+        self.__pending_columns.add(column)
+
+    def set_entry(self, row: int, column: int, weight: float) -> None:
+        old_cost = self.cost_matrix[row, column]
+
+        self.weight_matrix[row, column] = weight
+        self.cost_matrix[row, column] = self.__get_costs(self.weight_matrix[row, column])
+
+        new_cost = self.cost_matrix[row, column]
+
+        if new_cost == old_cost or row in self.__pending_rows or column in self.__pending_columns:
+            return
+
+        is_matched = self.column_rows[column + 1] == row + 1
+        reduced_cost = new_cost - self.row_potentials[row + 1] - self.column_potentials[column + 1]
+
+        # the old duals still certify the matching unless a matched entry moved or a free one dropped below them
+        if is_matched or reduced_cost < 0:
+            self.__pending_rows.add(row)
+
+    def __reset(self) -> None:
+        import numpy as np
+
+        # the 1-indexed state of JonkerVolgenantAlgorithm.augment, kept between solves
+        self.row_potentials = np.zeros(self.size + 1)
+        self.column_potentials = np.zeros(self.size + 1)
+        self.column_rows = np.zeros(self.size + 1, dtype=np.int64)
+        self.previous_columns = np.zeros(self.size + 1, dtype=np.int64)
+
+        self.__pending_rows = set(range(self.size))
+        self.__pending_columns = set()
+
+    def __get_costs(self, weights: np.array) -> np.array:
+        import numpy as np
+
+        costs = -weights if self.is_maximization else weights
+
+        return np.where(np.isfinite(costs), costs, np.inf)
+
+    def __repair(self) -> None:
+        import numpy as np
+
+        free_rows = set(self.__pending_rows)
+
+        # a changed column drops its pair and takes the largest potential its new costs allow
+        for column in self.__pending_columns:
+            free_rows.add(self.column_rows[column + 1] - 1)
+            self.column_rows[column + 1] = 0
+
+            slacks = self.cost_matrix[:, column] - self.row_potentials[1:]
+            self.column_potentials[column + 1] = slacks.min() if np.isfinite(slacks.min()) else 0
+
+        # a changed row does the same, after the columns so it sees their new potentials
+        for row in self.__pending_rows:
+            self.column_rows[self.column_rows == row + 1] = 0
+
+            slacks = self.cost_matrix[row] - self.column_potentials[1:]
+
+            if not np.isfinite(slacks.min()):
+                raise ValueError("No feasible assignment avoids the forbidden pairs!")
+
+            self.row_potentials[row + 1] = slacks.min()
+
+        # every remaining pair is still tight and every reduced cost non-negative, so one path per freed row
+        for row in sorted(free_rows - {-1}):
+            JonkerVolgenantAlgorithm.augment(
+                self.cost_matrix,
+                row + 1,
+                self.row_potentials,
+                self.column_potentials,
+                self.column_rows,
+                self.previous_columns
+            )
+
+        self.__pending_rows.clear()
+        self.__pending_columns.clear()
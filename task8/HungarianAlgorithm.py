@@ -1,19 +1,28 @@
-import numpy as np
+from __future__ import annotations
+
+from task8.JonkerVolgenantAlgorithm import JonkerVolgenantAlgorithm
 
 class HungarianAlgorithm:
 
     @staticmethod
     def execute(
             weight_matrix: np.array,
-            is_maximization: bool = False
+            is_maximization: bool = False,
+            forbidden_mask: np.array = None,
+            is_reduction_engine: bool = False,
     ) -> np.array:
 
+        import numpy as np
+
         weight_matrix = np.array(weight_matrix)
 
         rows_count, columns_count = weight_matrix.shape
 
-        if rows_count != columns_count:
-            raise ValueError("Matrix must be square!")
+        # the augmenting path engine is always optimal; the line-cover reduction is kept on request
+        # and only ever sees the dense square matrices it was written for
+        if not is_reduction_engine or rows_count != columns_count or forbidden_mask is not None \
+                or not np.isfinite(weight_matrix).all():
+            return JonkerVolgenantAlgorithm.execute(weight_matrix, is_maximization, forbidden_mask)
 
         reduced_matrix = HungarianAlgorithm.__reduce_matrix(
             weight_matrix,
@@ -33,6 +42,27 @@ class HungarianAlgorithm:
             marked_matrix
         )
 
+    @staticmethod
+    def solve(
+            weight_matrix: np.array,
+            is_maximization: bool = False,
+            forbidden_mask: np.array = None,
+            is_low_memory: bool = False,
+    ) -> (np.array, float):
+        # the reduction engine rewrites a full copy of the matrix, the augmenting path engine only reads it row by row
+        return JonkerVolgenantAlgorithm.solve(weight_matrix, is_maximization, forbidden_mask, is_low_memory)
+
+    @staticmethod
+    def solve_batch(
+            weight_matrices: np.array,
+            is_maximization: bool = False,
+            workers_count: int | None = None,
+    ) -> (np.array, np.array):
+        # the process pool and shared memory machinery is only loaded by the callers that batch
+        from task8.BatchAssignmentAlgorithm import BatchAssignmentAlgorithm
+
+        return BatchAssignmentAlgorithm.solve_batch(weight_matrices, is_maximization, workers_count)
+
     @staticmethod
     def __extract_marked_elements(
             weight_matrix: np.array,
@@ -50,6 +80,8 @@ class HungarianAlgorithm:
             rows_count: int,
             columns_count: int
     ) -> np.array:
+        import numpy as np
+
         row_cover = np.zeros(rows_count, dtype=bool)
         col_cover = np.zeros(columns_count, dtype=bool)
 
@@ -87,6 +119,8 @@ class HungarianAlgorithm:
             rows_count: int,
             columns_count: int
     ) -> np.array:
+        import numpy as np
+
         row_cover = np.zeros(rows_count, dtype=bool)
         col_cover = np.zeros(columns_count, dtype=bool)
         marked_matrix = np.zeros((rows_count, columns_count), dtype=bool)
@@ -124,6 +158,8 @@ class HungarianAlgorithm:
             rows_count: int,
             columns_count: int
     ) -> np.array:
+        import numpy as np
+
         row_cover, col_cover = HungarianAlgorithm.get_minimal_line_cover(
             reduced_matrix,
             marked_matrix,
@@ -197,23 +233,25 @@ class HungarianAlgorithm:
         return weight_matrix
 
 
-weight_matrix = [
-    [7, 3, 6, 9, 5],
-    [7, 5, 7, 5, 6],
-    [7, 6, 8, 8, 9],
-    [3, 1, 6, 5, 7],
-    [2, 4, 9, 9, 5]
-]
+if __name__ == '__main__':
+    import numpy as np
 
-# weight_matrix = [
-#         [4, 1, 3],
-#         [2, 0, 5],
-#         [3, 2, 2]
-#     ]
+    weight_matrix = [
+        [7, 3, 6, 9, 5],
+        [7, 5, 7, 5, 6],
+        [7, 6, 8, 8, 9],
+        [3, 1, 6, 5, 7],
+        [2, 4, 9, 9, 5]
+    ]
 
-# result = HungarianAlgorithm.execute(weight_matrix)
-result = HungarianAlgorithm.execute(weight_matrix, is_maximization=True)
+    # weight_matrix = [
+    #         [4, 1, 3],
+    #         [2, 0, 5],
+    #         [3, 2, 2]
+    #     ]
 
-print(result)
-print(np.sum(result))
+    # result = HungarianAlgorithm.execute(weight_matrix)
+    result = HungarianAlgorithm.execute(weight_matrix, is_maximization=True)
 
+    print(result)
+    print(np.sum(result))
@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+class JonkerVolgenantAlgorithm:
+
+    @staticmethod
+    def execute(
+            weight_matrix: np.array,
+            is_maximization: bool = False,
+            forbidden_mask: np.array = None,
+    ) -> np.array:
+        import numpy as np
+
+        weight_matrix = np.array(weight_matrix)
+
+        assigned_rows, assigned_columns = JonkerVolgenantAlgorithm.get_assignment(
+            weight_matrix,
+            is_maximization,
+            forbidden_mask
+        )
+
+        return weight_matrix[assigned_rows, assigned_columns].tolist()
+
+    @staticmethod
+    def solve(
+            weight_matrix: np.array,
+            is_maximization: bool = False,
+            forbidden_mask: np.array = None,
+            is_low_memory: bool = False,
+    ) -> (np.array, float):
+        import numpy as np
+
+        weight_matrix = np.asarray(weight_matrix)
+
+        assigned_rows, assigned_columns = JonkerVolgenantAlgorithm.get_assignment(
+            weight_matrix,
+            is_maximization,
+            forbidden_mask,
+            is_low_memory
+        )
+
+        # rows left over in a tall matrix keep -1
+        row_columns = np.full(weight_matrix.shape[0], -1, dtype=np.int64)
+        row_columns[assigned_rows] = assigned_columns
+
+        total_cost = weight_matrix[assigned_rows, assigned_columns].sum(dtype=np.float64)
+
+        return row_columns, float(total_cost)
+
+    @staticmethod
+    def get_assignment(
+            weight_matrix: np.array,
+            is_maximization: bool = False,
+            forbidden_mask: np.array = None,
+            is_low_memory: bool = False,
+    ) -> (np.array, np.array):
+        import numpy as np
+
+        weight_matrix = np.asarray(weight_matrix)
+
+        if weight_matrix.ndim != 2:
+            raise ValueError("Matrix must be two-dimensional!")
+
+        rows_count, columns_count = weight_matrix.shape
+
+        if forbidden_mask is not None:
+            forbidden_mask = np.asarray(forbidden_mask, dtype=bool)
+
+        if is_low_memory:
+            # the matrix (float32, int32 or a memmap) is never copied, every scanned row is converted on its own
+            cost_matrix = weight_matrix
+        else:
+            cost_matrix = -weight_matrix if is_maximization else weight_matrix
+
+            # forbidden cells become +inf costs: they are never the cheapest column, so they cost no augmentation work
+            is_forbidden = ~np.isfinite(weight_matrix)
+            if forbidden_mask is not None:
+                is_forbidden |= forbidden_mask
+
+            if is_forbidden.any():
+                cost_matrix = np.where(is_forbidden, np.inf, cost_matrix)
+
+            cost_matrix = cost_matrix.astype(np.float64, copy=False)
+            is_maximization, forbidden_mask = False, None
+
+        # the smaller side is always the one that gets fully assigned
+        if rows_count <= columns_count:
+            return np.arange(rows_count), JonkerVolgenantAlgorithm.get_assigned_columns(
+                cost_matrix,
+                is_maximization,
+                forbidden_mask
+            )
+
+        assigned_rows = JonkerVolgenantAlgorithm.get_assigned_columns(
+            cost_matrix.T,
+            is_maximization,
+            None if forbidden_mask is None else forbidden_mask.T
+        )
+        order = np.argsort(assigned_rows)
+
+        return assigned_rows[order], np.arange(columns_count)[order]
+
+    @staticmethod
+    def __get_row_costs(
+            cost_matrix: np.array,
+            row: int,
+            is_maximization: bool,
+            forbidden_mask: np.array,
+    ) -> np.array:
+        import numpy as np
+
+        costs = cost_matrix[row]
+
+        # +inf already means forbidden, so a row is usable as is unless it holds -inf or nan
+        if costs.dtype == np.float64 and not is_maximization and forbidden_mask is None and costs.min() > -np.inf:
+            return costs
+
+        costs = costs.astype(np.float64)
+
+        if is_maximization:
+            np.negative(costs, out=costs)
+
+        costs[~np.isfinite(costs)] = np.inf
+
+        if forbidden_mask is not None:
+            costs[forbidden_mask[row]] = np.inf
+
+        return costs
+
+    @staticmethod
+    def get_assigned_columns(
+            cost_matrix: np.array,
+            is_maximization: bool = False,
+            forbidden_mask: np.array = None,
+    ) -> np.array:
+        import numpy as np
+
+        rows_count, columns_count = cost_matrix.shape
+
+        # index 0 is a virtual column used as the root of every augmenting path
+        row_potentials = np.zeros(rows_count + 1)
+        column_potentials = np.zeros(columns_count + 1)
+        column_rows = np.zeros(columns_count + 1, dtype=np.int64)
+        previous_columns = np.zeros(columns_count + 1, dtype=np.int64)
+
+        for row in range(1, rows_count + 1):
+            JonkerVolgenantAlgorithm.augment(
+                cost_matrix,
+                row,
+                row_potentials,
+                column_potentials,
+                column_rows,
+                previous_columns,
+                is_maximization,
+                forbidden_mask
+            )
+
+        assigned_columns = np.empty(rows_count, dtype=np.int64)
+        assigned_columns[column_rows[1:][column_rows[1:] > 0] - 1] = np.flatnonzero(column_rows[1:] > 0)
+
+        return assigned_columns
+
+    @staticmethod
+    def augment(
+            cost_matrix: np.array,
+            row: int,
+            row_potentials: np.array,
+            column_potentials: np.array,
+            column_rows: np.array,
+            previous_columns: np.array,
+            is_maximization: bool = False,
+            forbidden_mask: np.array = None,
+    ) -> None:
+        import numpy as np
+
+        # rows are 1-indexed here, column_rows[0] is the virtual column the path grows from
+        columns_count = column_potentials.size - 1
+
+        column_rows[0] = row
+        current_column = 0
+
+        min_reduced_costs = np.full(columns_count + 1, np.inf)
+        is_visited = np.zeros(columns_count + 1, dtype=bool)
+
+        while True:
+            is_visited[current_column] = True
+            current_row = column_rows[current_column]
+
+            row_costs = JonkerVolgenantAlgorithm.__get_row_costs(
+                cost_matrix,
+                current_row - 1,
+                is_maximization,
+                forbidden_mask
+            )
+
+            reduced_costs = row_costs - row_potentials[current_row] - column_potentials[1:]
+            is_improved = ~is_visited[1:] & (reduced_costs < min_reduced_costs[1:])
+
+            min_reduced_costs[1:][is_improved] = reduced_costs[is_improved]
+            previous_columns[1:][is_improved] = current_column
+
+            candidate_costs = np.where(is_visited[1:], np.inf, min_reduced_costs[1:])
+            next_column = int(np.argmin(candidate_costs)) + 1
+            delta = candidate_costs[next_column - 1]
+
+            if delta == np.inf:
+                raise ValueError("No feasible assignment avoids the forbidden pairs!")
+
+            row_potentials[column_rows[is_visited]] += delta
+            column_potentials[is_visited] -= delta
+            min_reduced_costs[~is_visited] -= delta
+
+            current_column = next_column
+
+            if column_rows[current_column] == 0:
+                break
+
+        while current_column:
+            previous_column = previous_columns[current_column]
+            column_rows[current_column] = column_rows[previous_column]
+            current_column = previous_column